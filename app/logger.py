@@ -1,7 +1,12 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
 def setup_logger():
     """Configure logging with PHI-safe practices"""
     # Create logs directory if it doesn't exist
@@ -11,21 +16,39 @@ def setup_logger():
     # Create a unique log file for each session
     log_filename = os.path.join('logs', f'phi_cleanse_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
     
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_filename),
-            logging.StreamHandler()
-        ]
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.FileHandler(log_filename, delay=True)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    # Log calls only enqueue the record; a background listener thread does
+    # the actual writes so the UI and sanitizer threads never block on I/O
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
     )
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener.start()
+    
+    # Configure logging
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(queue_handler)
+    
+    def shutdown():
+        """Drain the queue and log directly for anything logged later at exit"""
+        root.removeHandler(queue_handler)
+        listener.stop()
+        root.addHandler(file_handler)
+        root.addHandler(stream_handler)
+    
+    atexit.register(shutdown)
     
     # Create logger instance
     logger = logging.getLogger('phi_cleanse')
     
     # Add PHI warning
-    logger.info('PHI CLEANSE TOOL - DO NOT LOG SENSITIVE INFORMATION')
-    logger.info('Logging session started')
+    logger.info('PHI CLEANSE TOOL - DO NOT LOG SENSITIVE INFORMATION\nLogging session started')
     
     return logger
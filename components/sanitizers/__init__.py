@@ -21,6 +21,7 @@ from .dates import (
     DOBSanitizer,
     AppointmentDateSanitizer
 )
+from .classifier import classify_value
 
 # Map field types to their sanitizers
 SANITIZER_MAP = {
@@ -1,18 +1,45 @@
+import functools
 import logging
 from abc import ABC, abstractmethod
 import json
-import os
+
+from .persistence import MAPPING_JSON_SEPARATORS, get_persister
 
 logger = logging.getLogger('phi_cleanse')
 
+# Case classes returned by _classify_case
+_MIXED, _UPPER, _LOWER, _CAPITALIZED = range(4)
+
+@functools.lru_cache(maxsize=65536)
+def _classify_case(value):
+    """Classify the case of a non-empty string, cached per distinct value"""
+    if value.isupper():
+        return _UPPER
+    elif value.islower():
+        return _LOWER
+    elif value[0].isupper():
+        return _CAPITALIZED
+    return _MIXED
+
 class BaseSanitizer(ABC):
     """Base class for all data sanitizers"""
     
+    __slots__ = (
+        'mapping',
+        'reverse_mapping',
+        'shared_mapping',
+        'shared_mapping_file',
+        '_shared_reverse',
+        '_persister'
+    )
+    
     def __init__(self):
         self.mapping = {}
         self.reverse_mapping = {}
         self.shared_mapping = None
         self.shared_mapping_file = None
+        self._shared_reverse = {}
+        self._persister = None
     
     @abstractmethod
     def sanitize(self, value, preserve_format=True):
@@ -39,7 +66,13 @@ class BaseSanitizer(ABC):
         Returns:
             pandas.Series with sanitized values
         """
-        return series.apply(lambda x: self.sanitize(x, preserve_format))
+        # Sanitize each distinct value once and broadcast the results with
+        # Series.map; missing values are passed through untouched
+        lookup = {
+            value: self.sanitize(value, preserve_format)
+            for value in series.dropna().unique()
+        }
+        return series.map(lookup).where(series.notna(), series)
     
     def get_mapping(self):
         """Get the current value mapping"""
@@ -49,6 +82,9 @@ class BaseSanitizer(ABC):
         """Set a predefined value mapping"""
         if self.shared_mapping is not None:
             self.shared_mapping.update(mapping)
+            # Rebuild in place; the reverse index is shared with other sanitizers
+            self._shared_reverse.clear()
+            self._shared_reverse.update({v: k for k, v in self.shared_mapping.items()})
             self._save_shared_mapping()
         else:
             self.mapping = mapping
@@ -58,24 +94,23 @@ class BaseSanitizer(ABC):
         """Set a shared mapping for related fields"""
         self.shared_mapping = mapping
         self.shared_mapping_file = mapping_file
+        self._persister = get_persister(mapping, mapping_file) if mapping_file else None
+        if self._persister is not None:
+            self._shared_reverse = self._persister.reverse_mapping
+        else:
+            self._shared_reverse = {v: k for k, v in mapping.items()}
         logger.info(f"Using shared mapping from {mapping_file}")
     
     def _save_shared_mapping(self):
-        """Save the shared mapping to file"""
-        if self.shared_mapping is not None and self.shared_mapping_file:
-            try:
-                os.makedirs(os.path.dirname(self.shared_mapping_file), exist_ok=True)
-                with open(self.shared_mapping_file, 'w') as f:
-                    json.dump(self.shared_mapping, f, indent=2)
-                logger.info(f"Saved shared mapping to {self.shared_mapping_file}")
-            except Exception as e:
-                logger.error(f"Error saving shared mapping: {str(e)}")
+        """Save the full shared mapping to file"""
+        if self.shared_mapping is not None and self._persister is not None:
+            self._persister.compact()
     
     def save_mapping(self, filename):
         """Save the current mapping to a file"""
         try:
             with open(filename, 'w') as f:
-                json.dump(self.mapping, f, indent=2)
+                json.dump(self.mapping, f, separators=MAPPING_JSON_SEPARATORS)
             logger.info(f"Saved mapping to {filename}")
         except Exception as e:
             logger.error(f"Error saving mapping: {str(e)}")
@@ -95,10 +130,25 @@ class BaseSanitizer(ABC):
         self.mapping = {}
         self.reverse_mapping = {}
     
+    def _active_mappings(self):
+        """Get the (mapping, reverse_mapping) pair currently in use"""
+        if self.shared_mapping is not None:
+            return self.shared_mapping, self._shared_reverse
+        return self.mapping, self.reverse_mapping
+    
+    def _store_value(self, original_value, new_value):
+        """Record a new original -> sanitized pair in the active mapping"""
+        mapping, reverse_mapping = self._active_mappings()
+        mapping[original_value] = new_value
+        reverse_mapping[new_value] = original_value
+        
+        # Queue the new entry for the background writer if using a shared mapping
+        if self.shared_mapping is not None and self._persister is not None:
+            self._persister.enqueue(original_value, new_value)
+    
     def _get_consistent_value(self, original_value):
         """Get a consistent sanitized value for a given input"""
-        mapping = self.shared_mapping if self.shared_mapping is not None else self.mapping
-        reverse_mapping = {v: k for k, v in mapping.items()}
+        mapping, reverse_mapping = self._active_mappings()
         
         if original_value in mapping:
             return mapping[original_value]
@@ -111,13 +161,7 @@ class BaseSanitizer(ABC):
             new_value = self._generate_value(original_value)
         
         # Store mapping
-        mapping[original_value] = new_value
-        
-        # Save shared mapping if using one
-        if self.shared_mapping is not None:
-            self._save_shared_mapping()
-        else:
-            self.reverse_mapping[new_value] = original_value
+        self._store_value(original_value, new_value)
         
         return new_value
     
@@ -130,13 +174,14 @@ class BaseSanitizer(ABC):
         """Preserve the format of the original value"""
         if not original or not new:
             return new
-            
+        
         # Preserve case
-        if original.isupper():
+        case = _classify_case(original)
+        if case == _UPPER:
             return new.upper()
-        elif original.islower():
+        elif case == _LOWER:
             return new.lower()
-        elif original[0].isupper():
+        elif case == _CAPITALIZED:
             return new.capitalize()
         
         return new
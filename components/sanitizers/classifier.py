@@ -0,0 +1,50 @@
+import re
+from .contact import _PHONE_SOURCE
+from .identifiers import _SSN_RE, _MEDICAID_RES
+
+def _unanchored(pattern):
+    """Strip the ^...$ anchors from a compiled pattern's source"""
+    source = pattern.pattern
+    if source.startswith('^'):
+        source = source[1:]
+    if source.endswith('$'):
+        source = source[:-1]
+    return source
+
+# Whole-value phone number shape: the sanitizer's pattern (which is only
+# searched for) with an optional country code and opening parenthesis
+_PHONE_VALUE_SOURCE = r'(?:\+?1[.\s-]*)?\(?' + _PHONE_SOURCE
+
+# Field types that can be recognized from a value, with their patterns
+_VALUE_PATTERNS = (
+    ('ssn', _unanchored(_SSN_RE)),
+    ('phone_number', _PHONE_VALUE_SOURCE),
+    ('medicaid_number', '|'.join(_unanchored(p) for p in _MEDICAID_RES)),
+)
+
+# One scanner for all patterns: each is an optional lookahead anchored at
+# both ends, so a single match() reports every pattern the value satisfies
+_SCANNER = re.compile(''.join(
+    f'(?:(?=(?P<{field_type}>(?:{source})$))|)'
+    for field_type, source in _VALUE_PATTERNS
+))
+
+def classify_value(value):
+    """
+    Find the field types a value looks like
+    
+    Args:
+        value: The value to classify
+        
+    Returns:
+        Tuple of matching field types (e.g. ('ssn', 'medicaid_number')),
+        empty if the value matches none of them
+    """
+    if not value or not isinstance(value, str):
+        return ()
+    
+    match = _SCANNER.match(value.strip())
+    return tuple(
+        field_type for field_type, _ in _VALUE_PATTERNS
+        if match.group(field_type) is not None
+    )
@@ -1,16 +1,74 @@
+import functools
 import logging
 import re
+import pandas as pd
 from faker import Faker
 from .base import BaseSanitizer
 
 logger = logging.getLogger('phi_cleanse')
 
+# Faker is expensive to construct, so every sanitizer here shares one instance
+# loaded with just the providers these generators need (street addresses
+# and user names are built from person and company data)
+_PROVIDERS = [
+    'faker.providers.address',
+    'faker.providers.company',
+    'faker.providers.internet',
+    'faker.providers.lorem',
+    'faker.providers.person'
+]
+_FAKER = Faker(providers=_PROVIDERS)
+
+# Apartment/unit designator, e.g. "Apt 4B", "#12", "Suite 300"
+_APT_RE = re.compile(r'(#|Apt\.?|Unit|Suite)\s*([A-Za-z0-9-]+)', re.IGNORECASE)
+
+# Phone number digits and separators, shared by the patterns below and the
+# value classifier so they cannot drift apart
+_PHONE_SOURCE = (
+    r'(?P<area>\d{3})?(?P<sep1>[).\s-]*)'
+    r'(?P<prefix>\d{3})(?P<sep2>[.\s-]*)'
+    r'(?P<line>\d{4})'
+    r'(?P<ext>\s*(?:ext|x|ext\.)\s*\d+)?'
+)
+
+# Pattern to identify phone number format
+_PHONE_RE = re.compile(_PHONE_SOURCE)
+
+# Same pattern anchored at the start with the surrounding text captured, so
+# Series.str.extract can recover the whole format in one pass
+_PHONE_PARTS_RE = re.compile(r'(?P<lead>.*?)' + _PHONE_SOURCE, re.DOTALL)
+
+@functools.lru_cache(maxsize=1024)
+def _phone_template(area_format, separator, ext):
+    """
+    Build the formatter for one phone number format
+    
+    Columns usually hold only a handful of formats, so each one is turned
+    into a str.format template once and reused for every number in it.
+    
+    Args:
+        area_format: Original text up to the prefix, with the area code as XXX
+        separator: Separator between the prefix and line digits
+        ext: Extension to append (may be empty)
+        
+    Returns:
+        Bound format method taking (area, prefix, line)
+    """
+    def escape(text):
+        return text.replace('{', '{{').replace('}', '}}')
+    
+    template = (
+        '{0}'.join(escape(piece) for piece in area_format.split('XXX'))
+        + '{1}' + escape(separator) + '{2}' + escape(ext)
+    )
+    return template.format
+
 class AddressSanitizer(BaseSanitizer):
     """Sanitizer for addresses"""
     
-    def __init__(self):
-        super().__init__()
-        self.fake = Faker()
+    __slots__ = ()
+    
+    fake = _FAKER
     
     def sanitize(self, value, preserve_format=True):
         if not value or not isinstance(value, str):
@@ -23,14 +81,12 @@ class AddressSanitizer(BaseSanitizer):
             sanitized = self._preserve_format(value, sanitized)
             
             # Try to preserve apartment/unit format
-            apt_match = re.search(r'(#|Apt\.?|Unit|Suite)\s*([A-Za-z0-9-]+)', value, re.IGNORECASE)
+            apt_match = _APT_RE.search(value)
             if apt_match:
                 # Replace the generated address's apt/unit number with original format
-                sanitized = re.sub(
-                    r'(#|Apt\.?|Unit|Suite)\s*([A-Za-z0-9-]+)',
+                sanitized = _APT_RE.sub(
                     f"{apt_match.group(1)} {apt_match.group(2)}",
-                    sanitized,
-                    flags=re.IGNORECASE
+                    sanitized
                 )
         
         return sanitized
@@ -42,16 +98,10 @@ class AddressSanitizer(BaseSanitizer):
 class PhoneNumberSanitizer(BaseSanitizer):
     """Sanitizer for phone numbers"""
     
-    def __init__(self):
-        super().__init__()
-        self.fake = Faker()
-        # Pattern to identify phone number format
-        self.pattern = re.compile(r'''
-            (?P<area>\d{3})?[).\s-]*
-            (?P<prefix>\d{3})[.\s-]*
-            (?P<line>\d{4})
-            (?P<ext>\s*(?:ext|x|ext.)\s*\d+)?
-        ''', re.VERBOSE)
+    __slots__ = ()
+    
+    fake = _FAKER
+    pattern = _PHONE_RE
     
     def sanitize(self, value, preserve_format=True):
         if not value or not isinstance(value, str):
@@ -63,28 +113,63 @@ class PhoneNumberSanitizer(BaseSanitizer):
             # Try to match original format
             match = self.pattern.search(value)
             if match:
-                # Get the original formatting
-                area_format = value[:match.start('prefix')].replace(
-                    match.group('area') or '', 'XXX'
-                )
-                separator = value[match.start('prefix'):match.start('line')].replace(
-                    match.group('prefix'), ''
+                return self._apply_format(
+                    sanitized,
+                    value[:match.start('prefix')],
+                    match.group('area'),
+                    value[match.end('prefix'):match.start('line')],
+                    match.group('ext')
                 )
-                
-                # Apply original formatting
-                parts = sanitized.split('-')
-                if len(parts) == 3:
-                    area, prefix, line = parts
-                    formatted = area_format.replace('XXX', area) + prefix + separator + line
-                    
-                    # Add extension if original had one
-                    if match.group('ext'):
-                        formatted += match.group('ext')
-                    
-                    return formatted
         
         return sanitized
     
+    def sanitize_series(self, series, preserve_format=True):
+        """
+        Sanitize a pandas series of phone numbers
+        
+        The format of every distinct value is extracted in a single
+        Series.str.extract pass instead of one regex search per value.
+        """
+        if not preserve_format:
+            return super().sanitize_series(series, preserve_format)
+        
+        uniques = [
+            value for value in series.dropna().unique()
+            if value and isinstance(value, str)
+        ]
+        parts = pd.Series(uniques, dtype=object).str.extract(_PHONE_PARTS_RE).fillna('')
+        
+        # Values sanitize() would pass through map to themselves
+        lookup = {value: value for value in series.dropna().unique()}
+        for value, row in zip(uniques, parts.itertuples(index=False)):
+            sanitized = self._get_consistent_value(value)
+            if row.prefix:
+                sanitized = self._apply_format(
+                    sanitized, row.lead + row.area + row.sep1, row.area, row.sep2, row.ext
+                )
+            lookup[value] = sanitized
+        
+        return series.map(lookup).where(series.notna(), series)
+    
+    @staticmethod
+    def _apply_format(sanitized, area_text, area, separator, ext):
+        """
+        Rebuild a sanitized ###-###-#### number in the original's format
+        
+        Args:
+            sanitized: The sanitized number
+            area_text: Original text up to the prefix digits
+            area: Original area code digits, if any
+            separator: Original separator between prefix and line digits
+            ext: Original extension, if any
+        """
+        parts = sanitized.split('-')
+        if len(parts) != 3:
+            return sanitized
+        
+        area_format = area_text.replace(area or '', 'XXX')
+        return _phone_template(area_format, separator, ext or '')(*parts)
+    
     def _generate_value(self, original_value):
         """Generate a new phone number"""
         return self.fake.numerify('###-###-####')
@@ -92,9 +177,9 @@ class PhoneNumberSanitizer(BaseSanitizer):
 class EmailSanitizer(BaseSanitizer):
     """Sanitizer for email addresses"""
     
-    def __init__(self):
-        super().__init__()
-        self.fake = Faker()
+    __slots__ = ()
+    
+    fake = _FAKER
     
     def sanitize(self, value, preserve_format=True):
         if not value or not isinstance(value, str):
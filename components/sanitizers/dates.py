@@ -1,77 +1,184 @@
 import logging
 import re
 from datetime import datetime, timedelta
+import numpy as np
 from faker import Faker
 from .base import BaseSanitizer
 
 logger = logging.getLogger('phi_cleanse')
 
+# Shared by all date sanitizers; only the date/time provider is needed
+_FAKER = Faker(providers=['faker.providers.date_time'])
+_RNG = np.random.default_rng()
+
+# numpy day numbers count from 1970-01-01, which was a Thursday
+_EPOCH_WEEKDAY = 3
+
+def _format_shape(fmt):
+    """Classify a format by the first non-digit character it matches"""
+    i = 0
+    while i < len(fmt):
+        if fmt[i] != '%':
+            return fmt[i]
+        if fmt[i + 1] in 'bB':
+            return 'a'
+        i += 2
+    return None
+
+def _group_by_shape(formats):
+    """Group formats by the first non-digit character they expect"""
+    groups = {}
+    for fmt in formats:
+        groups.setdefault(_format_shape(fmt), []).append(fmt)
+    return {shape: tuple(group) for shape, group in groups.items()}
+
 class DateSanitizer(BaseSanitizer):
     """Base sanitizer for dates"""
     
+    __slots__ = ('_detected',)
+    
+    fake = _FAKER
+    
+    # Common date formats, shared by every instance
+    DATE_FORMATS = (
+        "%Y-%m-%d",      # 2023-12-31
+        "%m/%d/%Y",      # 12/31/2023
+        "%m-%d-%Y",      # 12-31-2023
+        "%d/%m/%Y",      # 31/12/2023
+        "%d-%m-%Y",      # 31-12-2023
+        "%b %d, %Y",     # Dec 31, 2023
+        "%B %d, %Y",     # December 31, 2023
+        "%Y%m%d",        # 20231231
+        "%m/%d/%y",      # 12/31/23
+        "%d/%m/%y",      # 31/12/23
+    )
+    
+    # Candidate formats keyed by the first non-digit character they expect
+    _FORMATS_BY_SHAPE = _group_by_shape(DATE_FORMATS)
+    
+    # Generated dates are shifted by up to this many days from the original
+    max_offset_days = 365
+    # Whether generated dates falling on a weekend move to the next Monday
+    skip_weekends = False
+    
     def __init__(self):
         super().__init__()
-        self.fake = Faker()
-        
-        # Common date formats
-        self.date_formats = [
-            "%Y-%m-%d",      # 2023-12-31
-            "%m/%d/%Y",      # 12/31/2023
-            "%m-%d-%Y",      # 12-31-2023
-            "%d/%m/%Y",      # 31/12/2023
-            "%d-%m-%Y",      # 31-12-2023
-            "%b %d, %Y",     # Dec 31, 2023
-            "%B %d, %Y",     # December 31, 2023
-            "%Y%m%d",        # 20231231
-            "%m/%d/%y",      # 12/31/23
-            "%d/%m/%y",      # 31/12/23
-        ]
+        
+        # Parsed (date, format) per raw value, None if it could not be parsed
+        self._detected = {}
     
-    def _parse_date(self, value):
-        """Try to parse date string using various formats"""
-        for fmt in self.date_formats:
+    @staticmethod
+    def _value_shape(value):
+        """Classify a value by its first non-digit character ('a' for letters)"""
+        for char in value:
+            if not char.isdecimal():
+                return 'a' if char.isalpha() else char
+        return None
+    
+    def _detect_date(self, value):
+        """
+        Parse a date string and detect its format
+        
+        Numeric directives only consume digits, so a value can only match the
+        formats sharing its first non-digit character. Those are tried in their
+        original order, so ambiguous values resolve to the same format as a
+        full scan would; unknown shapes still fall back to every format.
+        
+        Returns:
+            Tuple of (datetime, format) or None if no format matches
+        """
+        if value in self._detected:
+            return self._detected[value]
+        
+        text = value.strip()
+        candidates = self._FORMATS_BY_SHAPE.get(self._value_shape(text), self.DATE_FORMATS)
+        
+        strptime = datetime.strptime
+        result = None
+        for fmt in candidates:
             try:
-                return datetime.strptime(value.strip(), fmt)
+                result = (strptime(text, fmt), fmt)
+                break
             except ValueError:
                 continue
-        return None
+        
+        self._detected[value] = result
+        return result
+    
+    def _parse_date(self, value):
+        """Try to parse date string using various formats"""
+        detected = self._detect_date(value)
+        return detected[0] if detected else None
+    
+    def sanitize_series(self, series, preserve_format=True):
+        """
+        Sanitize a pandas series of dates
+        
+        Replacement dates for every parseable value not yet in the mapping
+        are generated in one vectorized batch before the values are formatted.
+        """
+        mapping, reverse_mapping = self._active_mappings()
+        missing = []
+        dates = []
+        for value in series.dropna().unique():
+            if not value or not isinstance(value, str) or value in mapping:
+                continue
+            detected = self._detect_date(value)
+            # Leave dates near the ends of the datetime range to _generate_value
+            if detected and 1000 < detected[0].year < 9999:
+                missing.append(value)
+                dates.append(detected[0].date())
+        
+        if missing:
+            new_values = self._generate_values_bulk(np.array(dates, dtype='datetime64[D]'))
+            for original, new in zip(missing, new_values):
+                # Collisions are left for _get_consistent_value to regenerate
+                if new not in reverse_mapping:
+                    self._store_value(original, new)
+        
+        return super().sanitize_series(series, preserve_format)
+    
+    def _generate_values_bulk(self, dates):
+        """Generate ISO replacement dates near each of the given dates"""
+        offsets = _RNG.integers(-self.max_offset_days, self.max_offset_days + 1, len(dates))
+        new_dates = dates + offsets
+        
+        if self.skip_weekends:
+            # Saturday (5) moves ahead two days, Sunday (6) one
+            weekday = (new_dates.astype(np.int64) + _EPOCH_WEEKDAY) % 7
+            new_dates = new_dates + np.where(weekday >= 5, 7 - weekday, 0)
+        
+        return np.datetime_as_string(new_dates, unit='D').tolist()
     
     def _format_date(self, date, original_format):
         """Format date according to original format"""
         try:
             return date.strftime(original_format)
         except ValueError:
-            return date.strftime(self.date_formats[0])  # fallback to ISO format
+            return date.strftime(self.DATE_FORMATS[0])  # fallback to ISO format
 
 class DOBSanitizer(DateSanitizer):
     """Sanitizer for dates of birth"""
     
+    __slots__ = ()
+    
     def sanitize(self, value, preserve_format=True):
         if not value or not isinstance(value, str):
             return value
         
         # Try to parse the original date
-        original_date = None
-        original_format = None
-        
-        for fmt in self.date_formats:
-            try:
-                original_date = datetime.strptime(value.strip(), fmt)
-                original_format = fmt
-                break
-            except ValueError:
-                continue
-        
-        if not original_date:
+        detected = self._detect_date(value)
+        if not detected:
             logger.warning(f"Could not parse date: {value}")
             return value
+        original_date, original_format = detected
         
         sanitized = self._get_consistent_value(value)
         
         if preserve_format and original_format:
             try:
                 # Parse the sanitized date and reformat it
-                sanitized_date = datetime.strptime(sanitized, self.date_formats[0])
+                sanitized_date = datetime.strptime(sanitized, self.DATE_FORMATS[0])
                 sanitized = self._format_date(sanitized_date, original_format)
             except ValueError as e:
                 logger.error(f"Error formatting date: {str(e)}")
@@ -85,7 +192,7 @@ class DOBSanitizer(DateSanitizer):
         
         if original_date:
             # Generate a date within 1 year of original
-            days_diff = self.fake.random_int(min=-365, max=365)
+            days_diff = self.fake.random_int(min=-self.max_offset_days, max=self.max_offset_days)
             new_date = original_date + timedelta(days=days_diff)
         else:
             # Fallback to random date between 18 and 90 years ago
@@ -97,32 +204,28 @@ class DOBSanitizer(DateSanitizer):
 class AppointmentDateSanitizer(DateSanitizer):
     """Sanitizer for appointment dates"""
     
+    __slots__ = ()
+    
+    max_offset_days = 30
+    skip_weekends = True
+    
     def sanitize(self, value, preserve_format=True):
         if not value or not isinstance(value, str):
             return value
         
         # Try to parse the original date
-        original_date = None
-        original_format = None
-        
-        for fmt in self.date_formats:
-            try:
-                original_date = datetime.strptime(value.strip(), fmt)
-                original_format = fmt
-                break
-            except ValueError:
-                continue
-        
-        if not original_date:
+        detected = self._detect_date(value)
+        if not detected:
             logger.warning(f"Could not parse date: {value}")
             return value
+        original_date, original_format = detected
         
         sanitized = self._get_consistent_value(value)
         
         if preserve_format and original_format:
             try:
                 # Parse the sanitized date and reformat it
-                sanitized_date = datetime.strptime(sanitized, self.date_formats[0])
+                sanitized_date = datetime.strptime(sanitized, self.DATE_FORMATS[0])
                 sanitized = self._format_date(sanitized_date, original_format)
             except ValueError as e:
                 logger.error(f"Error formatting date: {str(e)}")
@@ -136,11 +239,11 @@ class AppointmentDateSanitizer(DateSanitizer):
         
         if original_date:
             # Generate a date within 30 days of original
-            days_diff = self.fake.random_int(min=-30, max=30)
+            days_diff = self.fake.random_int(min=-self.max_offset_days, max=self.max_offset_days)
             new_date = original_date + timedelta(days=days_diff)
             
             # Avoid weekends
-            while new_date.weekday() >= 5:  # 5 = Saturday, 6 = Sunday
+            while self.skip_weekends and new_date.weekday() >= 5:  # 5 = Saturday, 6 = Sunday
                 new_date += timedelta(days=1)
         else:
             # Fallback to random future date
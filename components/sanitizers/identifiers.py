@@ -1,17 +1,39 @@
 import logging
 import random
 import re
+import numpy as np
 from faker import Faker
 from .base import BaseSanitizer
 
 logger = logging.getLogger('phi_cleanse')
 
+# Shared by the identifier sanitizers that need random data. They only use
+# the base lexify/numerify/bothify helpers, which every provider includes,
+# so load a single small provider instead of all of them
+_FAKER = Faker(providers=['faker.providers.python'])
+_RNG = np.random.default_rng()
+
+_SSN_RE = re.compile(r'^\d{3}-?\d{2}-?\d{4}$')
+
+# Common Medicaid number patterns:
+# - AA12345A (alpha-numeric with letter suffix)
+# - 1234567890 (pure numeric, length varies by state)
+# - AB-12345678 (with separators)
+_MEDICAID_RES = (
+    re.compile(r'^[A-Z]{2}\d{5}[A-Z]$'),  # AA12345A
+    re.compile(r'^\d{7,12}$'),            # Pure numeric
+    re.compile(r'^[A-Z]{2}-\d{8}$')       # With separator
+)
+
+_NONALNUM = re.compile(r'[^a-zA-Z0-9]')
+_NONALNUM_UPPER = re.compile(r'[^A-Z0-9]')
+
 class SSNSanitizer(BaseSanitizer):
     """Sanitizer for Social Security Numbers"""
     
-    def __init__(self):
-        super().__init__()
-        self.pattern = re.compile(r'^\d{3}-?\d{2}-?\d{4}$')
+    __slots__ = ()
+    
+    pattern = _SSN_RE
     
     def sanitize(self, value, preserve_format=True):
         if not value or not isinstance(value, str):
@@ -29,6 +51,49 @@ class SSNSanitizer(BaseSanitizer):
         
         return sanitized
     
+    def sanitize_series(self, series, preserve_format=True):
+        """
+        Sanitize a pandas series of SSNs
+        
+        Replacement SSNs for every value not yet in the mapping are generated
+        in one vectorized batch before the values are formatted.
+        """
+        mapping, reverse_mapping = self._active_mappings()
+        missing = [
+            value for value in series.dropna().unique()
+            if value and isinstance(value, str) and value not in mapping
+        ]
+        if missing:
+            new_values = self._generate_values_bulk(len(missing), reverse_mapping)
+            for original, new in zip(missing, new_values):
+                self._store_value(original, new)
+        
+        return super().sanitize_series(series, preserve_format)
+    
+    @staticmethod
+    def _draw_ssns(n):
+        """Draw n random SSNs (without dashes) as a numpy string array"""
+        area = _RNG.integers(1, 900, n)      # 900-999 are not valid area numbers
+        group = _RNG.integers(1, 100, n)
+        serial = _RNG.integers(1, 10000, n)
+        codes = area * 1_000_000 + group * 10_000 + serial
+        return np.char.zfill(codes.astype(str), 9)
+    
+    def _generate_values_bulk(self, n, used):
+        """Generate n distinct new SSNs that do not collide with used values"""
+        used = np.array(list(used), dtype=str)
+        picks = np.empty(0, dtype=str)
+        
+        # Oversample, drop duplicates and used values, and top up if short
+        while len(picks) < n:
+            candidates = np.concatenate([picks, self._draw_ssns((n - len(picks)) * 2)])
+            # Keep first occurrences in draw order so picks are not sorted
+            _, first = np.unique(candidates, return_index=True)
+            candidates = candidates[np.sort(first)]
+            picks = candidates[~np.isin(candidates, used)][:n]
+        
+        return picks.tolist()
+    
     def _generate_value(self, original_value):
         """Generate a new SSN"""
         # Generate area number (first 3 digits)
@@ -46,9 +111,9 @@ class SSNSanitizer(BaseSanitizer):
 class MRNSanitizer(BaseSanitizer):
     """Sanitizer for Medical Record Numbers"""
     
-    def __init__(self):
-        super().__init__()
-        self.fake = Faker()
+    __slots__ = ()
+    
+    fake = _FAKER
     
     def sanitize(self, value, preserve_format=True):
         if not value or not isinstance(value, str):
@@ -76,9 +141,9 @@ class MRNSanitizer(BaseSanitizer):
 class InsuranceIDSanitizer(BaseSanitizer):
     """Sanitizer for Insurance IDs"""
     
-    def __init__(self):
-        super().__init__()
-        self.fake = Faker()
+    __slots__ = ()
+    
+    fake = _FAKER
     
     def sanitize(self, value, preserve_format=True):
         if not value or not isinstance(value, str):
@@ -88,7 +153,7 @@ class InsuranceIDSanitizer(BaseSanitizer):
         
         if preserve_format:
             # Preserve any special formatting (dashes, spaces, etc.)
-            format_chars = re.findall(r'[^a-zA-Z0-9]', value)
+            format_chars = _NONALNUM.findall(value)
             if format_chars:
                 sanitized_parts = list(sanitized)
                 original_parts = list(value)
@@ -102,7 +167,7 @@ class InsuranceIDSanitizer(BaseSanitizer):
     def _generate_value(self, original_value):
         """Generate a new Insurance ID"""
         # Remove any non-alphanumeric characters
-        clean_value = re.sub(r'[^a-zA-Z0-9]', '', original_value)
+        clean_value = _NONALNUM.sub('', original_value)
         length = len(clean_value)
         
         # Generate pattern based on original
@@ -118,18 +183,10 @@ class InsuranceIDSanitizer(BaseSanitizer):
 class MedicaidNumberSanitizer(BaseSanitizer):
     """Sanitizer for Medicaid Numbers"""
     
-    def __init__(self):
-        super().__init__()
-        self.fake = Faker()
-        # Common Medicaid number patterns:
-        # - AA12345A (alpha-numeric with letter suffix)
-        # - 1234567890 (pure numeric, length varies by state)
-        # - AB-12345678 (with separators)
-        self.patterns = [
-            re.compile(r'^[A-Z]{2}\d{5}[A-Z]$'),  # AA12345A
-            re.compile(r'^\d{7,12}$'),            # Pure numeric
-            re.compile(r'^[A-Z]{2}-\d{8}$')       # With separator
-        ]
+    __slots__ = ()
+    
+    fake = _FAKER
+    patterns = _MEDICAID_RES
     
     def sanitize(self, value, preserve_format=True):
         if not value or not isinstance(value, str):
@@ -153,7 +210,7 @@ class MedicaidNumberSanitizer(BaseSanitizer):
     def _generate_value(self, original_value):
         """Generate a new Medicaid number matching the original format"""
         # Clean the original value
-        clean_value = re.sub(r'[^A-Z0-9]', '', original_value.upper())
+        clean_value = _NONALNUM_UPPER.sub('', original_value.upper())
         
         # Check which pattern it matches
         for pattern in self.patterns:
@@ -180,9 +237,9 @@ class MedicaidNumberSanitizer(BaseSanitizer):
 class DriversLicenseSanitizer(BaseSanitizer):
     """Sanitizer for Drivers License Numbers"""
     
-    def __init__(self):
-        super().__init__()
-        self.fake = Faker()
+    __slots__ = ()
+    
+    fake = _FAKER
     
     def sanitize(self, value, preserve_format=True):
         if not value or not isinstance(value, str):
@@ -1,15 +1,44 @@
 import logging
+from abc import abstractmethod
 from faker import Faker
+from faker.providers.person import Provider as PersonProvider
 from .base import BaseSanitizer
 
 logger = logging.getLogger('phi_cleanse')
 
+# One Faker instance for every name sanitizer, with only the person provider
+_PROVIDERS = ['faker.providers.person']
+_FAKER = Faker(providers=_PROVIDERS)
+
 class NameSanitizer(BaseSanitizer):
     """Base class for name sanitization"""
     
+    __slots__ = ('_pool', '_pool_names', '_pool_fake', '_pool_exhausted')
+    
+    fake = _FAKER
+    
+    # Number of names Faker generates each time the pool runs out
+    POOL_SIZE = 1000
+    
     def __init__(self):
         super().__init__()
-        self.fake = Faker()
+        
+        # Pre-generated distinct replacement names, consumed by _generate_value
+        self._pool = []
+        self._pool_names = set()
+        self._pool_fake = None
+        self._pool_exhausted = False
+    
+    @staticmethod
+    def set_locale(locale):
+        """
+        Switch every name sanitizer to a Faker instance for another locale
+        
+        Args:
+            locale: Faker locale code (e.g. 'en_US', 'de_DE')
+        """
+        NameSanitizer.fake = Faker(locale, providers=_PROVIDERS)
+        logger.info(f"Name sanitizers now use locale: {locale}")
     
     def sanitize(self, value, preserve_format=True):
         """
@@ -31,34 +60,150 @@ class NameSanitizer(BaseSanitizer):
             sanitized = self._preserve_format(value, sanitized)
         
         return sanitized
+    
+    def sanitize_series(self, series, preserve_format=True):
+        """
+        Sanitize a pandas series of names
+        
+        Mapping lookup, generation and case preservation are fused into one
+        loop over the distinct values, with the per-value calls bound to
+        locals so known names only cost a dict lookup.
+        """
+        mapping, _ = self._active_mappings()
+        get_consistent_value = self._get_consistent_value
+        preserve = self._preserve_format if preserve_format else None
+        
+        lookup = {}
+        for value in series.dropna().unique():
+            if not value or not isinstance(value, str):
+                lookup[value] = value
+                continue
+            
+            sanitized = mapping.get(value)
+            if sanitized is None:
+                sanitized = get_consistent_value(value)
+            lookup[value] = preserve(value, sanitized) if preserve else sanitized
+        
+        return series.map(lookup).where(series.notna(), series)
+    
+    def _generate_value(self, original_value):
+        """Take the next unused name from the pre-generated pool"""
+        # Names from another Faker instance are dropped (see set_locale)
+        if self._pool_fake is not self.fake:
+            self._pool = []
+            self._pool_names = set()
+            self._pool_fake = self.fake
+            self._pool_exhausted = False
+        
+        reverse_mapping = self._active_mappings()[1]
+        while True:
+            if not self._pool:
+                if self._pool_exhausted:
+                    # Faker is running out of new names; generate directly
+                    return self._fake_name()
+                self._fill_pool()
+                continue
+            
+            name = self._pool.pop()
+            if name not in reverse_mapping:
+                return name
+    
+    def _fill_pool(self):
+        """Generate the next batch of distinct names with Faker"""
+        for name in self._fake_names(self.POOL_SIZE):
+            if name not in self._pool_names:
+                self._pool_names.add(name)
+                self._pool.append(name)
+        
+        # Stop refilling once most draws are repeats, since batches would
+        # then cost far more Faker calls than the names they yield
+        if len(self._pool) < self.POOL_SIZE // 10:
+            self._pool_exhausted = True
+    
+    def _draw_names(self, method, n):
+        """
+        Draw n names from the word list behind a Faker person method
+        
+        Faker rebuilds the weight distribution of the word list on every
+        weighted random_element call, so drawing the whole batch with one
+        random_elements call is far cheaper. Locales that override the
+        method fall back to calling it once per name.
+        
+        Args:
+            method: Person provider method, 'first_name' or 'last_name'
+            n: Number of names to draw
+        """
+        generate = getattr(self.fake, method)
+        provider = getattr(generate, '__self__', None)
+        words = getattr(provider, method + 's', None)
+        if words is None or getattr(type(provider), method, None) is not getattr(PersonProvider, method):
+            return [generate() for _ in range(n)]
+        return list(provider.random_elements(words, length=n))
+    
+    def _fake_names(self, n):
+        """Generate n fresh names with Faker"""
+        return [self._fake_name() for _ in range(n)]
+    
+    @abstractmethod
+    def _fake_name(self):
+        """Generate one fresh name with Faker"""
+        pass
 
 class FullNameSanitizer(NameSanitizer):
     """Sanitizer for full names"""
     
-    def _generate_value(self, original_value):
+    __slots__ = ()
+    
+    # Full names come from Faker's format parser one at a time, so keep
+    # batches small to avoid generating many names that are never used
+    POOL_SIZE = 100
+    
+    def _fake_name(self):
         """Generate a new full name"""
         return self.fake.name()
 
 class FirstNameSanitizer(NameSanitizer):
     """Sanitizer for first names"""
     
-    def _generate_value(self, original_value):
+    __slots__ = ()
+    
+    def _fake_name(self):
         """Generate a new first name"""
         return self.fake.first_name()
+    
+    def _fake_names(self, n):
+        """Draw n first names in one batch"""
+        return self._draw_names('first_name', n)
 
 class LastNameSanitizer(NameSanitizer):
     """Sanitizer for last names"""
     
-    def _generate_value(self, original_value):
+    __slots__ = ()
+    
+    def _fake_name(self):
         """Generate a new last name"""
         return self.fake.last_name()
+    
+    def _fake_names(self, n):
+        """Draw n last names in one batch"""
+        return self._draw_names('last_name', n)
 
 class MiddleNameSanitizer(NameSanitizer):
     """Sanitizer for middle names"""
     
+    __slots__ = ()
+    
     def _generate_value(self, original_value):
         """Generate a new middle name"""
         # If original is just an initial
         if len(original_value) == 1:
             return self.fake.random_letter().upper()
+        return super()._generate_value(original_value)
+    
+    def _fake_name(self):
+        """Generate a new middle name"""
         return self.fake.first_name()  # Use first name as middle name
+    
+    def _fake_names(self, n):
+        """Draw n first names in one batch"""
+        return self._draw_names('first_name', n)
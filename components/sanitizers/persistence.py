@@ -0,0 +1,187 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger('phi_cleanse')
+
+# Sentinel telling the writer thread to finish its current batch and exit
+_STOP = object()
+
+# Mapping files are written without whitespace; they can hold millions of
+# entries and are not meant to be edited by hand
+MAPPING_JSON_SEPARATORS = (',', ':')
+
+# Active persisters keyed by mapping file path
+_persisters = {}
+_persisters_lock = threading.Lock()
+
+def _journal_path(mapping_file):
+    """Get the path of the JSONL journal kept next to a mapping file"""
+    return os.path.splitext(mapping_file)[0] + '.jsonl'
+
+class AsyncMappingPersister:
+    """
+    Persists shared mapping entries from a background writer thread
+    
+    New entries are queued by the sanitizers and appended to a JSONL journal
+    next to the mapping file in batches, so an insert never rewrites the whole
+    mapping. compact() folds the mapping back into the canonical JSON file and
+    removes the journal.
+    """
+    
+    def __init__(self, mapping, mapping_file, batch_interval=0.2, maxsize=10000):
+        self.mapping = mapping
+        # Reverse index shared by every sanitizer using this mapping, so a
+        # value added by one field is seen by the others' uniqueness checks
+        self.reverse_mapping = {v: k for k, v in mapping.items()}
+        self.mapping_file = mapping_file
+        self.journal_file = _journal_path(mapping_file)
+        self.batch_interval = batch_interval
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._dir_created = False
+    
+    def enqueue(self, original_value, sanitized_value):
+        """Queue a new mapping entry for the writer thread"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._writer_loop,
+                    name=f"mapping-writer:{os.path.basename(self.mapping_file)}",
+                    daemon=True
+                )
+                self._thread.start()
+        self._queue.put((original_value, sanitized_value))
+    
+    def _writer_loop(self):
+        """Drain the queue, batching entries for up to batch_interval seconds"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.batch_interval
+            while True:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            
+            self._write_batch(batch)
+            if stop:
+                return
+    
+    def _write_batch(self, batch):
+        """Append a batch of entries to the journal"""
+        try:
+            self._ensure_dir()
+            with open(self.journal_file, 'a') as f:
+                f.writelines(json.dumps({k: v}, separators=MAPPING_JSON_SEPARATORS) + "\n" for k, v in batch)
+        except Exception as e:
+            logger.error(f"Error writing mapping journal: {str(e)}")
+    
+    def _ensure_dir(self):
+        """Create the mapping directory on the first write only"""
+        if not self._dir_created:
+            os.makedirs(os.path.dirname(self.mapping_file), exist_ok=True)
+            self._dir_created = True
+    
+    def compact(self):
+        """Stop the writer and save the full mapping to the canonical JSON file"""
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(_STOP)
+                self._thread.join()
+                self._thread = None
+            
+            # Snapshot the mapping, since other threads may still be adding to
+            # it, and write it to a temporary file that replaces the canonical
+            # one only once complete; a failed save leaves the previous file
+            # and the journal untouched
+            snapshot = dict(self.mapping)
+            temp_file = self.mapping_file + '.tmp'
+            try:
+                self._ensure_dir()
+                with open(temp_file, 'w') as f:
+                    json.dump(snapshot, f, separators=MAPPING_JSON_SEPARATORS)
+                os.replace(temp_file, self.mapping_file)
+                if os.path.exists(self.journal_file):
+                    os.remove(self.journal_file)
+                logger.info(f"Saved shared mapping to {self.mapping_file}")
+            except Exception as e:
+                logger.error(f"Error saving shared mapping: {str(e)}")
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+
+def get_persister(mapping, mapping_file):
+    """Get the persister for a mapping file, replacing one bound to another dict"""
+    with _persisters_lock:
+        persister = _persisters.get(mapping_file)
+        if persister is not None and persister.mapping is mapping:
+            return persister
+        
+        if persister is not None:
+            persister.compact()
+        persister = AsyncMappingPersister(mapping, mapping_file)
+        _persisters[mapping_file] = persister
+        return persister
+
+def load_mapping_file(mapping_file):
+    """
+    Load a mapping file, replaying entries left in its journal
+    
+    Any active persister for the file is compacted first so that queued
+    entries are not lost.
+    
+    Args:
+        mapping_file: Path of the canonical JSON mapping file
+    
+    Returns:
+        Dictionary of original -> sanitized values
+    """
+    with _persisters_lock:
+        persister = _persisters.pop(mapping_file, None)
+    if persister is not None:
+        persister.compact()
+    
+    mapping = {}
+    if os.path.exists(mapping_file):
+        with open(mapping_file, 'r') as f:
+            mapping = json.load(f)
+    
+    journal_file = _journal_path(mapping_file)
+    if os.path.exists(journal_file):
+        with open(journal_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    mapping.update(json.loads(line))
+                except ValueError:
+                    logger.warning(f"Skipping corrupt entry in mapping journal: {journal_file}")
+    
+    return mapping
+
+def compact_all():
+    """Compact every active persister (registered to run at exit)"""
+    with _persisters_lock:
+        persisters = list(_persisters.values())
+    for persister in persisters:
+        persister.compact()
+
+atexit.register(compact_all)
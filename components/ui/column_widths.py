@@ -0,0 +1,26 @@
+import pandas as pd
+
+# Rows used to estimate the width of non-integer columns
+WIDTH_SAMPLE_ROWS = 200
+
+def content_length(series):
+    """
+    Estimate the longest displayed value of a column without stringifying all of it
+    
+    Integer widths follow from the column's extremes; other columns are
+    measured on their first WIDTH_SAMPLE_ROWS values, taking the length of
+    each cell directly instead of building string and length Series.
+    
+    Args:
+        series: The column to measure
+    
+    Returns:
+        Length in characters of the longest value (blank cells count as 0)
+    """
+    if len(series) == 0:
+        return 0
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return max(len(str(series.min())), len(str(series.max())))
+    
+    values = series.head(WIDTH_SAMPLE_ROWS).to_numpy(dtype=object, na_value="")
+    return max(len(value) if isinstance(value, str) else len(str(value)) for value in values)
@@ -20,6 +20,15 @@ class CommonRecordsDialog:
         self.group_vars = {}
         self.result = None
         
+        # Checkbox label for each column, shared by every group
+        self.field_labels = {}
+        for col in self.columns:
+            if col in self.detected_fields:
+                detection = self.detected_fields[col]
+                self.field_labels[col] = (f"{col} (PHI: {detection['field_type']})", True)
+            else:
+                self.field_labels[col] = (col, False)
+        
         self.setup_ui()
         
         # Center dialog
@@ -91,30 +100,36 @@ class CommonRecordsDialog:
         group_frame = ttk.LabelFrame(self.scrollable_frame, text=f"Record Group {len(self.group_vars) + 1}")
         group_frame.pack(fill="x", padx=5, pady=5)
         
-        # Add checkboxes for each field
-        field_vars = {}
+        # Add checkboxes for each field. Their selected state is read straight
+        # from the widgets in on_ok, so no BooleanVar is created per checkbox
+        field_boxes = {}
+        checkboxes = []
         for col in self.columns:
-            var = tk.BooleanVar(value=selected_fields and col in selected_fields)
-            field_vars[col] = var
-            
-            if col in self.detected_fields:
-                detection = self.detected_fields[col]
-                checkbox_text = f"{col} (PHI: {detection['field_type']})"
+            checkbox_text, is_phi = self.field_labels[col]
+            if is_phi:
                 checkbox = ttk.Checkbutton(
                     group_frame,
                     text=checkbox_text,
-                    variable=var,
                     style='PHI.TCheckbutton'
                 )
             else:
                 checkbox = ttk.Checkbutton(
                     group_frame,
-                    text=col,
-                    variable=var
+                    text=checkbox_text
                 )
-            checkbox.pack(anchor="w", padx=5)
+            # Without a variable the checkbox starts in the alternate state
+            if selected_fields and col in selected_fields:
+                checkbox.state(['!alternate', 'selected'])
+            else:
+                checkbox.state(['!alternate', '!selected'])
+            field_boxes[col] = checkbox
+            checkboxes.append(str(checkbox))
+        
+        # Pack all checkboxes with a single pack command
+        if checkboxes:
+            group_frame.tk.call('pack', *checkboxes, '-anchor', 'w', '-padx', 5)
         
-        self.group_vars[group_id] = field_vars
+        self.group_vars[group_id] = field_boxes
         
         # Add remove button
         ttk.Button(
@@ -135,8 +150,8 @@ class CommonRecordsDialog:
         common_records = {}
         for group_id, fields in self.group_vars.items():
             group_fields = []
-            for field, var in fields.items():
-                if var.get():
+            for field, checkbox in fields.items():
+                if checkbox.instate(['selected']):
                     group_fields.append(field)
             if group_fields:
                 common_records[group_id] = group_fields
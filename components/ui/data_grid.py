@@ -2,11 +2,40 @@ import tkinter as tk
 from tkinter import ttk, font
 import logging
 import pandas as pd
+from .column_widths import content_length
 from .field_config_dialog import FieldConfigDialog
+from .virtual_rows import VirtualRowsMixin
 
 logger = logging.getLogger('phi_cleanse')
 
-class DataGrid(ttk.Frame):
+# Whether the grid's ttk styles have been configured
+_styles_configured = False
+
+def _init_styles():
+    """Configure the grid's ttk styles; styles are global, so only once"""
+    global _styles_configured
+    if _styles_configured:
+        return
+    
+    style = ttk.Style()
+    
+    # Configure treeview styles
+    style.configure('Highlight.Treeview',
+                   background='white',
+                   fieldbackground='white')
+    
+    style.configure('Highlight.Treeview.Heading',
+                   background='#f5f5f5',  # Light gray for headings
+                   relief='raised')
+    
+    # Configure selection colors
+    style.map('Highlight.Treeview',
+             background=[('selected', '#e3f2fd')],  # Light blue when selected
+             foreground=[('selected', 'black')])    # Keep text black when selected
+    
+    _styles_configured = True
+
+class DataGrid(VirtualRowsMixin, ttk.Frame):
     """Data grid component with PHI highlighting and field configuration"""
     
     def __init__(self, parent, data_processor=None):
@@ -14,23 +43,15 @@ class DataGrid(ttk.Frame):
         self.data_processor = data_processor
         self.detected_fields = {}
         self.phi_columns = set()
+        self._columns = ()
+        self._phi_tags = []
+        self._configured_tags = set()  # PHI tags already given their style
+        self._field_dialog = None  # Reused for every field configured
+        self.config_enabled = True  # Cleared by ReviewTab while a preview is prepared
+        self.clicked_column = None
         
         # Configure custom styles
-        style = ttk.Style()
-        
-        # Configure treeview styles
-        style.configure('Highlight.Treeview',
-                       background='white',
-                       fieldbackground='white')
-        
-        style.configure('Highlight.Treeview.Heading',
-                       background='#f5f5f5',  # Light gray for headings
-                       relief='raised')
-        
-        # Configure selection colors
-        style.map('Highlight.Treeview',
-                 background=[('selected', '#e3f2fd')],  # Light blue when selected
-                 foreground=[('selected', 'black')])    # Keep text black when selected
+        _init_styles()
         
         self.setup_ui()
         self.setup_context_menu()
@@ -42,16 +63,15 @@ class DataGrid(ttk.Frame):
         self.container.pack(fill="both", expand=True)
         
         # Create scrollbars
-        y_scroll = ttk.Scrollbar(self.container)
-        y_scroll.pack(side="right", fill="y")
+        self.y_scroll = ttk.Scrollbar(self.container)
+        self.y_scroll.pack(side="right", fill="y")
         
         x_scroll = ttk.Scrollbar(self.container, orient="horizontal")
         x_scroll.pack(side="bottom", fill="x")
         
-        # Create treeview
+        # Create treeview. Only the visible rows are put in it (see VirtualRowsMixin)
         self.table = ttk.Treeview(
             self.container,
-            yscrollcommand=y_scroll.set,
             xscrollcommand=x_scroll.set,
             selectmode="extended",
             style='Highlight.Treeview'
@@ -59,17 +79,17 @@ class DataGrid(ttk.Frame):
         self.table.pack(side="left", fill="both", expand=True)
         
         # Configure scrollbars
-        y_scroll.config(command=self.table.yview)
         x_scroll.config(command=self.table.xview)
         
-        # Configure column resizing
-        self.table.bind('<B1-Motion>', self.on_column_resize)
-        
         # Bind events
         self.table.bind("<Shift-MouseWheel>", self.on_horizontal_scroll)
         
         # Configure PHI tag
         self.table.tag_configure('phi', background='#fff3e0')  # Light orange for PHI cells
+        
+        # Keep rows in Python and show only the visible window, scrolled by
+        # the vertical scrollbar and mouse wheel
+        self.setup_virtual_rows()
     
     def setup_context_menu(self):
         """Setup right-click context menu"""
@@ -83,25 +103,30 @@ class DataGrid(ttk.Frame):
         """Show context menu on right-click"""
         # Get clicked column
         region = self.table.identify("region", event.x, event.y)
-        if region == "heading":
+        if region == "heading" and self.config_enabled:
             self.clicked_column = self.table.identify_column(event.x)
             self.context_menu.post(event.x_root, event.y_root)
     
     def show_field_config(self):
         """Show field configuration dialog for clicked column"""
-        if not hasattr(self, 'clicked_column'):
+        if self.clicked_column is None or not self.config_enabled:
             return
             
         column_id = int(self.clicked_column[1]) - 1  # Convert #1 to 0, #2 to 1, etc.
-        field_name = self.table["columns"][column_id]
+        field_name = self._columns[column_id]
         
         # Get current field type if detected
         current_type = None
         if field_name in self.detected_fields:
             current_type = self.detected_fields[field_name]['field_type']
         
-        dialog = FieldConfigDialog(self, field_name, current_type)
-        self.wait_window(dialog)
+        # Build the dialog once and reset it for each later field
+        dialog = self._field_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._field_dialog = FieldConfigDialog(self, field_name, current_type)
+        else:
+            dialog.reconfigure(field_name, current_type)
+        dialog.wait_closed()
         
         if dialog.result:
             logger.info(f"Field {field_name} configured: {dialog.result}")
@@ -114,36 +139,42 @@ class DataGrid(ttk.Frame):
             
             # Update PHI columns set
             self.phi_columns.add(field_name)
+            self.update_phi_tags()
             
             # Refresh the data to update PHI highlighting
             self.refresh_data()
+        
+        self.clicked_column = None
     
     def refresh_data(self):
         """Refresh the data display with current PHI settings"""
-        # Store current data
-        data = []
-        for item in self.table.get_children():
-            values = self.table.item(item)['values']
-            data.append(values)
-        
-        # Clear and reinsert with updated PHI highlighting
-        self.table.delete(*self.table.get_children())
-        for values in data:
-            self.insert_row(values)
+        # Retag the visible rows in place; rows scrolled in later pick up
+        # the current tags when their items are created
+        for item in self._slots:
+            self.table.item(item, tags=self._phi_tags)
+    
+    def update_phi_tags(self):
+        """Configure the PHI column tags once and cache the per-row tag list"""
+        self._phi_tags = []
+        for col_idx, col in enumerate(self._columns):
+            if col in self.phi_columns:
+                tag = f'phi_{col_idx}'
+                self._phi_tags.append(tag)
+                # Tag styles persist in Tk, so each is only configured once
+                if tag not in self._configured_tags:
+                    self.table.tag_configure(tag, background='#fff3e0')
+                    self._configured_tags.add(tag)
     
     def insert_row(self, values):
         """Insert a row with proper PHI highlighting"""
-        # Create list of tags for this row
-        tags = []
-        for col_idx, col in enumerate(self.table["columns"]):
-            if col in self.phi_columns:
-                tags.append(f'phi_{col_idx}')
-                self.table.tag_configure(f'phi_{col_idx}', background='#fff3e0')
-        
-        # Insert row with tags
-        item_id = self.table.insert("", "end", values=values, tags=tags)
+        # Insert row with the precomputed PHI tags
+        item_id = self.table.insert("", "end", values=values, tags=self._phi_tags)
         return item_id
     
+    def row_tags(self):
+        """Rows are tagged with the PHI column tags"""
+        return self._phi_tags
+    
     def update_content(self, data, detected_fields=None):
         """Update table content with imported data"""
         if not isinstance(data, pd.DataFrame):
@@ -154,7 +185,7 @@ class DataGrid(ttk.Frame):
         self.detected_fields = detected_fields or {}
         
         # Clear existing items
-        self.table.delete(*self.table.get_children())
+        self.clear_rows()
         logger.info("Cleared existing items from table")
         
         # Configure columns
@@ -162,6 +193,7 @@ class DataGrid(ttk.Frame):
         logger.info(f"Configuring {len(columns)} columns: {columns}")
         self.table["columns"] = columns
         self.table["show"] = "headings"
+        self._columns = tuple(columns)
         
         # Configure each column
         for col_idx, col in enumerate(data.columns):
@@ -175,40 +207,25 @@ class DataGrid(ttk.Frame):
             
             self.table.heading(col, text=heading_text)
             
-            # Set column width and allow stretching
-            sample_width = min(
-                max(
-                    len(str(heading_text)) * 10,
-                    data[col].astype(str).str.len().max() * 10,
+            # Set column width and allow stretching, estimating the content
+            # width from the column's first rows
+            content_len = content_length(data[col])
+            sample_width = max(
+                min(
+                    max(len(str(heading_text)), content_len) * 10,
                     300  # Maximum width
                 ),
                 100  # Minimum width
             )
             self.table.column(col, width=sample_width, minwidth=100, stretch=True)
         
-        # Insert all data rows
-        logger.info(f"Inserting {len(data)} rows into table")
-        for idx, row in data.iterrows():
-            try:
-                # Convert all values to strings and handle None/NaN
-                values = []
-                for val in row:
-                    if pd.isna(val):
-                        values.append("")
-                    else:
-                        try:
-                            values.append(str(val))
-                        except Exception as e:
-                            logger.warning(f"Error converting value to string: {val}, using repr() instead")
-                            values.append(repr(val))
-                
-                # Insert row with PHI highlighting
-                self.insert_row(values)
-                logger.debug(f"Inserted row {idx}")
-                
-            except Exception as e:
-                logger.error(f"Error inserting row {idx}: {str(e)}")
-                logger.error(f"Row values: {values}")
+        self.update_phi_tags()
+        
+        # Load all data rows; only the visible ones are inserted into the table
+        logger.info(f"Loading {len(data)} rows into table")
+        
+        # Convert all values to strings in one pass, blanking None/NaN
+        self.set_rows(data.astype(str).mask(data.isna(), "").values.tolist())
         
         logger.info("Data grid update complete")
     
@@ -216,13 +233,3 @@ class DataGrid(ttk.Frame):
         """Handle horizontal scrolling with Shift+MouseWheel"""
         self.table.xview_scroll(int(-1 * (event.delta / 120)), "units")
         return "break"
-    
-    def on_column_resize(self, event):
-        """Handle column resize event"""
-        region = self.table.identify_region(event.x, event.y)
-        if region == "separator":
-            column = self.table.identify_column(event.x)
-            tree_x = event.x - self.table.winfo_rootx()
-            new_width = max(100, tree_x - self.table.column(column, "x"))
-            self.table.column(column, width=new_width)
-            return "break"
@@ -2,64 +2,110 @@ import tkinter as tk
 from tkinter import ttk
 import logging
 import csv
+import functools
 import os
 
 logger = logging.getLogger('phi_cleanse')
 
+@functools.lru_cache(maxsize=1)
+def _load_field_types():
+    """
+    Load field types and their expected data types from protected_fields.csv
+    
+    The file does not change while the app runs, so it is parsed once and
+    the result shared by every dialog.
+    """
+    field_types = {}
+    try:
+        csv_path = os.path.join('sample_data', 'protected_fields.csv')
+        with open(csv_path, 'r') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                field_types[row['field_type']] = {
+                    'description': row.get('description', ''),
+                    'data_type': row.get('data_type', 'string'),
+                    'format': row.get('format', '')
+                }
+    except Exception as e:
+        logger.error(f"Error loading field types: {str(e)}")
+        # Fallback to basic types if file can't be loaded
+        field_types = {
+            'full_name': {'data_type': 'string'},
+            'first_name': {'data_type': 'string'},
+            'last_name': {'data_type': 'string'},
+            'date_of_birth': {'data_type': 'date'},
+            'ssn': {'data_type': 'string'},
+            'medicaid_number': {'data_type': 'string'},
+            'address': {'data_type': 'string'},
+            'phone_number': {'data_type': 'string'},
+            'email': {'data_type': 'string'}
+        }
+    return field_types
+
 class FieldConfigDialog(tk.Toplevel):
     """Dialog for configuring field sanitization settings"""
     
     def __init__(self, parent, field_name, field_type=None):
         super().__init__(parent)
-        self.title(f"Configure Field: {field_name}")
         self.geometry("400x600")
         self.transient(parent)
-        self.grab_set()
+        
+        # The dialog is hidden rather than destroyed when closed, so the
+        # same widgets can be reused for the next field
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self._closed = tk.BooleanVar(value=False)
+        
+        # Load field types and data types from protected_fields.csv
+        self.field_types = self.load_field_types()
+        
+        self.type_var = tk.StringVar()
+        self.setup_ui()
+        self.reconfigure(field_name, field_type)
+    
+    def reconfigure(self, field_name, field_type=None):
+        """
+        Reset the dialog for another field and show it again
+        
+        Args:
+            field_name: Name of the field to configure
+            field_type: Currently configured field type, if any
+        """
+        self.title(f"Configure Field: {field_name}")
         
         # Store field info
         self.field_name = field_name
         self.field_type = field_type
         self.result = None
         
-        # Load field types and data types from protected_fields.csv
-        self.field_types = self.load_field_types()
+        self.type_var.set(field_type or "")
+        self.preserve_format.set(True)
+        self.consistent_mapping.set(True)
+        self.update_field_info()
         
-        self.setup_ui()
+        self.deiconify()
+        self.grab_set()
+        self._closed.set(False)
         
         # Center dialog
         self.update_idletasks()
-        x = parent.winfo_rootx() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_rooty() + (parent.winfo_height() - self.winfo_height()) // 2
+        x = self.master.winfo_rootx() + (self.master.winfo_width() - self.winfo_width()) // 2
+        y = self.master.winfo_rooty() + (self.master.winfo_height() - self.winfo_height()) // 2
         self.geometry(f"+{x}+{y}")
     
+    def wait_closed(self):
+        """Wait until the dialog is closed with OK or Cancel"""
+        if not self._closed.get():
+            self.wait_variable(self._closed)
+    
+    def close(self):
+        """Hide the dialog so it can be shown again by reconfigure"""
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
+    
     def load_field_types(self):
         """Load field types and their expected data types from protected_fields.csv"""
-        field_types = {}
-        try:
-            csv_path = os.path.join('sample_data', 'protected_fields.csv')
-            with open(csv_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    field_types[row['field_type']] = {
-                        'description': row.get('description', ''),
-                        'data_type': row.get('data_type', 'string'),
-                        'format': row.get('format', '')
-                    }
-        except Exception as e:
-            logger.error(f"Error loading field types: {str(e)}")
-            # Fallback to basic types if file can't be loaded
-            field_types = {
-                'full_name': {'data_type': 'string'},
-                'first_name': {'data_type': 'string'},
-                'last_name': {'data_type': 'string'},
-                'date_of_birth': {'data_type': 'date'},
-                'ssn': {'data_type': 'string'},
-                'medicaid_number': {'data_type': 'string'},
-                'address': {'data_type': 'string'},
-                'phone_number': {'data_type': 'string'},
-                'email': {'data_type': 'string'}
-            }
-        return field_types
+        return _load_field_types()
     
     def setup_ui(self):
         """Setup the dialog UI"""
@@ -67,41 +113,37 @@ class FieldConfigDialog(tk.Toplevel):
         type_frame = ttk.LabelFrame(self, text="Field Type", padding=10)
         type_frame.pack(fill="x", padx=10, pady=5)
         
-        self.type_var = tk.StringVar(value=self.field_type or "")
-        self.type_var.trace('w', self.on_type_change)
-        
-        # Add field type options
-        for field_type, info in self.field_types.items():
-            frame = ttk.Frame(type_frame)
-            frame.pack(fill="x", pady=2)
-            
-            radio = ttk.Radiobutton(
-                frame,
+        # Add field type options, one grid row per type so no per-row frame is needed
+        for row, (field_type, info) in enumerate(self.field_types.items()):
+            ttk.Radiobutton(
+                type_frame,
                 text=field_type.replace("_", " ").title(),
                 value=field_type,
-                variable=self.type_var
-            )
-            radio.pack(side="left")
+                variable=self.type_var,
+                command=self.update_field_info
+            ).grid(row=row, column=0, sticky="w", pady=2)
             
             if info.get('data_type'):
                 ttk.Label(
-                    frame,
+                    type_frame,
                     text=f"({info['data_type']})",
                     foreground='gray'
-                ).pack(side="left", padx=5)
+                ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
         
         # Data type info
         self.info_frame = ttk.LabelFrame(self, text="Field Information", padding=10)
         self.info_frame.pack(fill="x", padx=10, pady=5)
         
-        self.info_label = ttk.Label(self.info_frame, wraplength=350)
+        self.info_text = tk.StringVar()
+        self.info_label = ttk.Label(self.info_frame, textvariable=self.info_text, wraplength=350)
         self.info_label.pack(fill="x")
         
         # Format example
         self.format_frame = ttk.LabelFrame(self, text="Expected Format", padding=10)
         self.format_frame.pack(fill="x", padx=10, pady=5)
         
-        self.format_label = ttk.Label(self.format_frame, wraplength=350)
+        self.format_text = tk.StringVar()
+        self.format_label = ttk.Label(self.format_frame, textvariable=self.format_text, wraplength=350)
         self.format_label.pack(fill="x")
         
         # Sanitization options
@@ -133,14 +175,7 @@ class FieldConfigDialog(tk.Toplevel):
         button_frame.pack(fill="x", padx=10, pady=10)
         
         ttk.Button(button_frame, text="OK", command=self.on_ok).pack(side="right", padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side="right")
-        
-        # Update info for initial field type
-        self.update_field_info()
-    
-    def on_type_change(self, *args):
-        """Handle field type change"""
-        self.update_field_info()
+        ttk.Button(button_frame, text="Cancel", command=self.close).pack(side="right")
     
     def update_field_info(self):
         """Update field information display"""
@@ -150,18 +185,18 @@ class FieldConfigDialog(tk.Toplevel):
             
             # Update description
             if info.get('description'):
-                self.info_label.config(text=info['description'])
+                self.info_text.set(info['description'])
             else:
-                self.info_label.config(text="No description available")
+                self.info_text.set("No description available")
             
             # Update format example
             if info.get('format'):
-                self.format_label.config(text=f"Example: {info['format']}")
+                self.format_text.set(f"Example: {info['format']}")
             else:
-                self.format_label.config(text="No format example available")
+                self.format_text.set("No format example available")
         else:
-            self.info_label.config(text="")
-            self.format_label.config(text="")
+            self.info_text.set("")
+            self.format_text.set("")
     
     def on_ok(self):
         """Save configuration and close dialog"""
@@ -179,4 +214,4 @@ class FieldConfigDialog(tk.Toplevel):
             'preserve_format': self.preserve_format.get(),
             'consistent_mapping': self.consistent_mapping.get()
         }
-        self.destroy()
+        self.close()
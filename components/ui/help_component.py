@@ -4,12 +4,7 @@ import logging
 
 logger = logging.getLogger('phi_cleanse')
 
-class HelpComponent(ttk.Frame):
-    """A help component that displays instructions in a popup window"""
-    def __init__(self, parent):
-        super().__init__(parent)
-        
-        self.help_text = """PHI Cleanse Tool Documentation
+_HELP_TEXT = """PHI Cleanse Tool Documentation
 
 Overview
 --------
@@ -65,6 +60,12 @@ Notes
 - Regular review of sanitized data helps ensure proper configuration
 
 """
+
+class HelpComponent(ttk.Frame):
+    """A help component that displays instructions in a popup window"""
+    def __init__(self, parent):
+        super().__init__(parent)
+        
         # Create help button with ? symbol
         self.help_button = ttk.Button(self, text="?", width=3, command=self.show_help)
         self.help_button.pack(side="right", padx=5)
@@ -80,7 +81,7 @@ Notes
         text_widget.pack(expand=True, fill="both")
         
         # Insert help text
-        text_widget.insert("1.0", self.help_text)
+        text_widget.insert("1.0", _HELP_TEXT)
         text_widget.config(state="disabled")  # Make text read-only
         
         # Add close button
@@ -1,17 +1,100 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+from pandas.io.parsers import TextParser
 
 from utils.data_processor import DataProcessor
 
 logger = logging.getLogger('phi_cleanse')
 
+# How often the UI checks on a running import (milliseconds)
+IMPORT_POLL_MS = 100
+
+def get_sheet_names(filename):
+    """
+    List the worksheet names of an Excel workbook
+    
+    For .xlsx files only the workbook part is read, and the file is closed
+    again before a worksheet is chosen.
+    
+    Args:
+        filename: Path to the workbook
+        
+    Returns:
+        List of worksheet names
+    """
+    if filename.lower().endswith('.xls'):
+        with pd.ExcelFile(filename) as excel_file:
+            return excel_file.sheet_names
+    
+    workbook = load_workbook(filename, read_only=True, keep_links=False)
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+def read_xlsx_sheet(filename, sheet_name):
+    """
+    Read one worksheet of an .xlsx workbook
+    
+    The workbook is opened in openpyxl's read-only mode and rows are streamed
+    as plain values rather than cell objects. Blanks, error values and
+    trailing empty rows are handled as in pandas.read_excel and the rows are
+    parsed with the same TextParser, so headers and dtypes come out the same.
+    
+    Args:
+        filename: Path to the workbook
+        sheet_name: Name of the worksheet to read
+        
+    Returns:
+        DataFrame with the worksheet contents
+    """
+    workbook = load_workbook(filename, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = workbook[sheet_name]
+        # Writers often store a wrong dimension (e.g. A1:A1), which would
+        # truncate the rows read-only mode returns
+        sheet.reset_dimensions()
+        
+        rows = []
+        last_row_with_data = -1
+        for row_number, row in enumerate(sheet.iter_rows(values_only=True)):
+            # Blank cells become '' (parsed as NaN) like read_excel does
+            row = ['' if value is None else value for value in row]
+            while row and row[-1] == '':
+                row.pop()
+            if row:
+                last_row_with_data = row_number
+            rows.append(row)
+    finally:
+        workbook.close()
+    
+    # Trim trailing empty rows and pad the rest to the same width
+    rows = rows[:last_row_with_data + 1]
+    if not rows:
+        return pd.DataFrame()
+    width = max(len(row) for row in rows)
+    rows = [row + [''] * (width - len(row)) for row in rows]
+    
+    # Cached error results such as #DIV/0! come through as text
+    return TextParser(rows, header=0, na_values=list(ERROR_CODES)).read()
+
 class ImportTab(ttk.Frame):
     """Tab for importing and initially processing files"""
     def __init__(self, parent):
         super().__init__(parent)
         self.data_processor = DataProcessor()
+        self.review_tab = None  # Set by MainWindow
+        
+        # Files are read and analyzed off the Tk thread, one import at a time
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._import_progress = (0, "")
+        self._shown_progress = None
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -68,99 +151,169 @@ class ImportTab(ttk.Frame):
         try:
             # Show progress
             self.progress_frame.place(relx=0.5, rely=0.6, anchor="center")
-            self.progress_var.set(0)
-            self.progress_label.config(text="Reading file...")
+            # Error messages bypass _show_progress, so always redraw here
+            self._shown_progress = None
+            self._show_progress(0, "Reading file...")
+            # Draw it now since reading the sheet names below blocks
             self.update_idletasks()
             
-            # Import based on file type
-            if filename.lower().endswith('.csv'):
-                try:
-                    # First try with default settings
-                    self.imported_data = pd.read_csv(filename)
-                except pd.errors.ParserError:
-                    # If that fails, try with more flexible parsing
-                    logger.info("Retrying CSV import with error_bad_lines=False")
-                    self.imported_data = pd.read_csv(
-                        filename,
-                        on_bad_lines='skip',  # Skip lines with too many fields
-                        encoding='utf-8',     # Explicitly set encoding
-                        engine='python'       # Use python engine for better error handling
-                    )
-                    messagebox.showwarning(
-                        "Import Warning",
-                        "Some rows in the CSV file had inconsistent formatting and were skipped. "
-                        "Please check the data carefully."
-                    )
-                logger.info(f"Imported CSV file: {filename}")
-            else:  # Excel file
-                # Get list of sheets
-                excel_file = pd.ExcelFile(filename)
-                if len(excel_file.sheet_names) > 1:
-                    sheet_name = self.select_sheet(excel_file.sheet_names)
+            # The worksheet is chosen here since the dialog needs the UI thread
+            sheet_name = None
+            if not filename.lower().endswith('.csv'):
+                sheet_names = get_sheet_names(filename)
+                if len(sheet_names) > 1:
+                    sheet_name = self.select_sheet(sheet_names)
                     if not sheet_name:
                         return
                 else:
-                    sheet_name = excel_file.sheet_names[0]
-                
-                self.imported_data = pd.read_excel(filename, sheet_name=sheet_name)
-                logger.info(f"Imported Excel file: {filename}, sheet: {sheet_name}")
+                    sheet_name = sheet_names[0]
             
-            # Update progress
-            self.progress_var.set(50)
-            self.progress_label.config(text="Analyzing fields...")
-            self.update_idletasks()
+            # Read and analyze the file on the worker thread
+            self._import_progress = (0, "Reading file...")
+            self.import_button.config(state="disabled")
+            future = self._executor.submit(self._read_and_analyze, filename, sheet_name)
+            self.after(IMPORT_POLL_MS, self._poll_import, future)
             
-            # Basic data validation
-            if self.imported_data.empty:
-                raise ValueError("The imported file contains no data")
-            
-            if len(self.imported_data.columns) < 2:
-                raise ValueError("The file must contain at least two columns")
-            
-            # Check for completely empty columns
-            empty_cols = self.imported_data.columns[self.imported_data.isna().all()].tolist()
-            if empty_cols:
-                messagebox.showwarning(
-                    "Empty Columns Detected",
-                    f"The following columns are completely empty and will be removed:\n"
-                    f"{', '.join(empty_cols)}"
-                )
-                self.imported_data = self.imported_data.drop(columns=empty_cols)
-            
-            # Process file and detect PHI fields
-            self.progress_var.set(75)
-            self.progress_label.config(text="Analyzing fields for PHI...")
-            self.update_idletasks()
-            
-            self.imported_data, detected_fields = self.data_processor.process_file(self.imported_data)
+        except Exception as e:
+            logger.error(f"Error importing file: {str(e)}")
+            self.progress_label.config(text=f"Error: {str(e)}")
+    
+    def _read_and_analyze(self, filename, sheet_name):
+        """
+        Read the file and detect PHI fields (runs on the worker thread)
+        
+        No Tk calls are made here; progress is published through
+        self._import_progress and messages are left for _on_import_done.
+        
+        Args:
+            filename: Path of the file to import
+            sheet_name: Worksheet to read, or None for CSV files
             
-            # Show summary of detected fields
-            if detected_fields:
-                messagebox.showinfo(
-                    "PHI Fields Detected",
-                    f"Detected {len(detected_fields)} potential PHI fields.\n"
-                    "Please review the field configurations in the next tab."
-                )
+        Returns:
+            Tuple of (data, detected fields, bad lines skipped, empty columns removed)
+        """
+        skipped_lines = False
+        
+        # Import based on file type
+        if sheet_name is None:
+            try:
+                # First try with default settings
+                data = pd.read_csv(filename)
+            except pd.errors.ParserError:
+                # If that fails, try with more flexible parsing
+                logger.info("Retrying CSV import with error_bad_lines=False")
+                try:
+                    # The C engine can skip lines with too many fields
+                    # itself and is much faster than the python engine
+                    data = pd.read_csv(
+                        filename,
+                        on_bad_lines='skip',  # Skip lines with too many fields
+                        encoding='utf-8'      # Explicitly set encoding
+                    )
+                except pd.errors.ParserError:
+                    # Malformed quoting still needs the python engine
+                    logger.info("Retrying CSV import with the python engine")
+                    data = pd.read_csv(
+                        filename,
+                        on_bad_lines='skip',
+                        encoding='utf-8',
+                        engine='python'       # Use python engine for better error handling
+                    )
+                skipped_lines = True
+            logger.info(f"Imported CSV file: {filename}")
+        else:  # Excel file
+            if filename.lower().endswith('.xls'):
+                # Legacy .xls workbooks are not supported by openpyxl
+                data = pd.read_excel(filename, sheet_name=sheet_name)
             else:
-                messagebox.showwarning(
-                    "No PHI Fields Detected",
-                    "No potential PHI fields were detected. Please review the data "
-                    "and manually configure any fields that contain sensitive information."
-                )
-            
-            # Complete progress
-            self.progress_var.set(100)
-            self.progress_label.config(text="Import complete!")
-            self.update_idletasks()
-            
-            # Store detected fields and switch to review tab
-            self.detected_fields = detected_fields
-            self.after(1000, self.switch_to_review)
-            
+                data = read_xlsx_sheet(filename, sheet_name)
+            logger.info(f"Imported Excel file: {filename}, sheet: {sheet_name}")
+        
+        # Update progress
+        self._import_progress = (50, "Analyzing fields...")
+        
+        # Basic data validation
+        if data.empty:
+            raise ValueError("The imported file contains no data")
+        
+        if len(data.columns) < 2:
+            raise ValueError("The file must contain at least two columns")
+        
+        # Remove completely empty columns. A column with a value in the first
+        # row cannot be empty, so only the others need a full scan
+        candidates = data.columns[data.iloc[0].isna().to_numpy()]
+        empty_cols = candidates[data[candidates].isna().all().to_numpy()].tolist()
+        if empty_cols:
+            data = data.drop(columns=empty_cols)
+        
+        # Process file and detect PHI fields
+        self._import_progress = (75, "Analyzing fields for PHI...")
+        
+        data, detected_fields = self.data_processor.process_file(data)
+        return data, detected_fields, skipped_lines, empty_cols
+    
+    def _poll_import(self, future):
+        """Show worker progress until the import finishes"""
+        self._show_progress(*self._import_progress)
+        
+        if not future.done():
+            self.after(IMPORT_POLL_MS, self._poll_import, future)
+            return
+        
+        self.import_button.config(state="normal")
+        try:
+            self._on_import_done(*future.result())
         except Exception as e:
             logger.error(f"Error importing file: {str(e)}")
             self.progress_label.config(text=f"Error: {str(e)}")
     
+    def _show_progress(self, value, text):
+        """Update the progress widgets, skipping the Tk calls if nothing changed"""
+        if (value, text) == self._shown_progress:
+            return
+        self._shown_progress = (value, text)
+        self.progress_var.set(value)
+        self.progress_label.config(text=text)
+    
+    def _on_import_done(self, data, detected_fields, skipped_lines, empty_cols):
+        """Report the import results and move on to the review tab"""
+        if skipped_lines:
+            messagebox.showwarning(
+                "Import Warning",
+                "Some rows in the CSV file had inconsistent formatting and were skipped. "
+                "Please check the data carefully."
+            )
+        
+        if empty_cols:
+            messagebox.showwarning(
+                "Empty Columns Detected",
+                f"The following columns are completely empty and were removed:\n"
+                f"{', '.join(empty_cols)}"
+            )
+        
+        self.imported_data = data
+        
+        # Show summary of detected fields
+        if detected_fields:
+            messagebox.showinfo(
+                "PHI Fields Detected",
+                f"Detected {len(detected_fields)} potential PHI fields.\n"
+                "Please review the field configurations in the next tab."
+            )
+        else:
+            messagebox.showwarning(
+                "No PHI Fields Detected",
+                "No potential PHI fields were detected. Please review the data "
+                "and manually configure any fields that contain sensitive information."
+            )
+        
+        # Complete progress; it is drawn once control returns to the event loop
+        self._show_progress(100, "Import complete!")
+        
+        # Store detected fields and switch to review tab
+        self.detected_fields = detected_fields
+        self.after(1000, self.switch_to_review)
+    
     def select_sheet(self, sheet_names):
         """Display dialog for sheet selection"""
         dialog = tk.Toplevel(self)
@@ -231,13 +384,11 @@ class ImportTab(ttk.Frame):
     def switch_to_review(self):
         """Switch to the review tab and update its content"""
         notebook = self.master
-        review_tab_index = 1  # Index of review tab
-        review_tab = notebook.winfo_children()[review_tab_index]
         
         # Log data state before passing to review tab
         logger.info(f"Switching to review tab with data shape: {self.imported_data.shape}")
         logger.info(f"Number of detected PHI fields: {len(self.detected_fields)}")
         logger.info(f"First few rows of data:\n{self.imported_data.head()}")
         
-        review_tab.update_content(self.imported_data)
-        notebook.select(review_tab_index)
+        self.review_tab.update_content(self.imported_data)
+        notebook.select(self.review_tab)
@@ -30,6 +30,12 @@ class MainWindow:
         self.review_tab = ReviewTab(self.tab_control)
         self.preview_tab = PreviewTab(self.tab_control)
         
+        # Let the tabs reach each other directly
+        self.import_tab.review_tab = self.review_tab
+        self.review_tab.import_tab = self.import_tab
+        self.preview_tab.import_tab = self.import_tab
+        self.preview_tab.review_tab = self.review_tab
+        
         # Add tabs to notebook
         self.tab_control.add(self.import_tab, text='Import File')
         self.tab_control.add(self.review_tab, text='Review & Configure')
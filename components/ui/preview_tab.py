@@ -1,17 +1,44 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import os
+from .column_widths import content_length
+from .virtual_rows import VirtualRowsMixin
 
 logger = logging.getLogger('phi_cleanse')
 
-class PreviewTab(ttk.Frame):
+# How often the UI checks on a running export or preview (milliseconds)
+EXPORT_POLL_MS = 100
+PREVIEW_POLL_MS = 100
+
+# Tcl procedure setting the heading and width of every column in one call
+_SET_COLUMNS_PROC = 'phi_cleanse_set_columns'
+_SET_COLUMNS_SCRIPT = f"""
+proc {_SET_COLUMNS_PROC} {{tree columns widths}} {{
+    foreach column $columns width $widths {{
+        $tree heading $column -text $column
+        $tree column $column -width $width
+    }}
+}}
+"""
+
+class PreviewTab(VirtualRowsMixin, ttk.Frame):
     """Tab for previewing sanitized data and exporting"""
     def __init__(self, parent):
         super().__init__(parent)
         self.data_processor = None
         self.sanitized_data = None
+        self.import_tab = None  # Set by MainWindow
+        self.review_tab = None  # Set by MainWindow
+        self._row_tags = ()
+        
+        # Previews are prepared and CSV files written off the Tk thread, one
+        # task at a time
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_preview = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -48,23 +75,23 @@ class PreviewTab(ttk.Frame):
     def create_table(self):
         """Create the data preview table"""
         # Create scrollbars
-        y_scroll = ttk.Scrollbar(self.main_frame)
-        y_scroll.pack(side="right", fill="y")
+        self.y_scroll = ttk.Scrollbar(self.main_frame)
+        self.y_scroll.pack(side="right", fill="y")
         
         x_scroll = ttk.Scrollbar(self.main_frame, orient="horizontal")
         x_scroll.pack(side="bottom", fill="x")
         
-        # Create treeview
+        # Create treeview. Only the visible rows are put in it (see VirtualRowsMixin)
         self.table = ttk.Treeview(
             self.main_frame,
-            yscrollcommand=y_scroll.set,
             xscrollcommand=x_scroll.set
         )
         self.table.pack(fill="both", expand=True)
         
         # Configure scrollbars
-        y_scroll.config(command=self.table.yview)
         x_scroll.config(command=self.table.xview)
+        self.setup_virtual_rows()
+        self.tk.eval(_SET_COLUMNS_SCRIPT)
         
         # Configure tags for highlighting
         self.table.tag_configure(
@@ -79,39 +106,97 @@ class PreviewTab(ttk.Frame):
             return
         
         # Get data processor from import tab
-        import_tab = self.master.winfo_children()[0]  # First tab is import tab
-        self.data_processor = import_tab.get_processor()
+        self.data_processor = self.import_tab.get_processor()
         
-        # Sanitize data
-        self.sanitized_data = self.data_processor.sanitize_data()
-        if self.sanitized_data is None:
+        # Sanitize and convert the rows on the worker thread; only the Tk
+        # calls are left for _show_preview. The worker gets a snapshot of the
+        # configuration, and edits that would touch the sanitizers or their
+        # shared mappings are blocked until it is done
+        configuration = self.data_processor.snapshot_configuration()
+        self.review_tab.set_configuration_enabled(False)
+        self.sanitized_data = None
+        self.export_button.config(state="disabled")
+        self.status_var.set("Sanitizing data...")
+        future = self._executor.submit(self._prepare_preview, data, configuration)
+        self._pending_preview = future
+        self.after(PREVIEW_POLL_MS, self._poll_preview, future)
+    
+    def _prepare_preview(self, data, configuration):
+        """
+        Sanitize the data and build the table contents (runs on the worker thread)
+        
+        Args:
+            data: The configured DataFrame whose columns are shown
+            configuration: Snapshot from DataProcessor.snapshot_configuration
+            
+        Returns:
+            Tuple of (sanitized DataFrame, columns, column widths, rows as
+            string lists), or None if the data could not be sanitized
+        """
+        sanitized = self.data_processor.sanitize_data(*configuration)
+        if sanitized is None:
+            return None
+        
+        # Set column widths based on content
+        columns = tuple(data.columns)
+        widths = tuple(
+            int(min(max(len(str(col)), content_length(data[col])) * 10, 300))
+            for col in columns
+        )
+        
+        # Keep all rows as strings; only the visible ones are inserted
+        rows = sanitized.astype(str).mask(sanitized.isna(), "").values.tolist()
+        return sanitized, columns, widths, rows
+    
+    def _poll_preview(self, future):
+        """Wait for the preview to be prepared and show it"""
+        if not future.done():
+            self.after(PREVIEW_POLL_MS, self._poll_preview, future)
             return
         
+        # A newer update_content call has replaced this one
+        if future is not self._pending_preview:
+            return
+        
+        self.review_tab.set_configuration_enabled(True)
+        self.export_button.config(state="normal")
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Error preparing preview: {str(e)}")
+            self.status_var.set(f"Error: {str(e)}")
+            return
+        
+        if result is None:
+            self.status_var.set("")
+            return
+        self._show_preview(*result)
+    
+    def _show_preview(self, sanitized, columns, widths, rows):
+        """Fill the table with prepared sanitized rows"""
+        self.sanitized_data = sanitized
+        
         # Clear existing items
-        self.table.delete(*self.table.get_children())
+        self.clear_rows()
         
-        # Configure columns
-        self.table["columns"] = list(data.columns)
+        # Configure columns, then all headings and widths in a single Tcl call
+        self.table["columns"] = columns
         self.table["show"] = "headings"
+        self.tk.call(_SET_COLUMNS_PROC, str(self.table), columns, widths)
         
-        for col in data.columns:
-            self.table.heading(col, text=col)
-            # Set column width based on content
-            max_width = max(
-                len(str(col)),
-                data[col].astype(str).str.len().max()
-            ) * 10
-            self.table.column(col, width=min(max_width, 300))
-        
-        # Insert data and highlight sanitized fields
-        for idx, row in self.sanitized_data.iterrows():
-            item_id = self.table.insert("", "end", values=list(row))
-            
-            # Highlight sanitized columns
-            for col, value in row.items():
-                if col in self.data_processor.field_configs:
-                    col_idx = list(self.sanitized_data.columns).index(col)
-                    self.table.item(item_id, tags=('sanitized',))
+        # Every row gets the highlight tag if any of its columns is sanitized
+        has_sanitized_col = any(
+            col in self.data_processor.field_configs
+            for col in sanitized.columns
+        )
+        self._row_tags = ('sanitized',) if has_sanitized_col else ()
+        
+        self.set_rows(rows)
+        self.status_var.set(f"{len(sanitized)} rows")
+    
+    def row_tags(self):
+        """Rows are highlighted when any column was sanitized"""
+        return self._row_tags
     
     def export_data(self):
         """Export sanitized data to CSV"""
@@ -126,17 +211,31 @@ class PreviewTab(ttk.Frame):
         )
         
         if filename:
-            try:
-                # Export to CSV
-                self.sanitized_data.to_csv(filename, index=False)
-                self.status_var.set("Data exported successfully")
-                logger.info(f"Exported sanitized data to: {filename}")
-                messagebox.showinfo("Success", "Data exported successfully")
-            except Exception as e:
-                error_msg = f"Error exporting data: {str(e)}"
-                self.status_var.set(error_msg)
-                logger.error(error_msg)
-                messagebox.showerror("Error", error_msg)
+            # Export to CSV on the worker thread so the window keeps repainting
+            self.export_button.config(state="disabled")
+            self.status_var.set("Exporting data...")
+            future = self._executor.submit(
+                self.sanitized_data.to_csv, filename, index=False
+            )
+            self.after(EXPORT_POLL_MS, self._poll_export, future, filename)
+    
+    def _poll_export(self, future, filename):
+        """Wait for a running export and report the result"""
+        if not future.done():
+            self.after(EXPORT_POLL_MS, self._poll_export, future, filename)
+            return
+        
+        self.export_button.config(state="normal")
+        try:
+            future.result()
+            self.status_var.set("Data exported successfully")
+            logger.info(f"Exported sanitized data to: {filename}")
+            messagebox.showinfo("Success", "Data exported successfully")
+        except Exception as e:
+            error_msg = f"Error exporting data: {str(e)}"
+            self.status_var.set(error_msg)
+            logger.error(error_msg)
+            messagebox.showerror("Error", error_msg)
     
     def highlight_sanitized_fields(self, sanitized_columns):
         """Highlight columns that have been sanitized"""
@@ -16,6 +16,7 @@ class ReviewTab(ttk.Frame):
         super().__init__(parent)
         self.data_processor = None
         self.detected_fields = None
+        self.import_tab = None  # Set by MainWindow
         self.setup_ui()
     
     def setup_ui(self):
@@ -42,11 +43,27 @@ class ReviewTab(ttk.Frame):
             command=self.save_configuration
         ).pack(side="right", padx=5)
         
-        ttk.Button(
+        self.load_config_btn = ttk.Button(
             action_frame,
             text="Load Configuration",
             command=self.load_configuration
-        ).pack(side="right")
+        )
+        self.load_config_btn.pack(side="right")
+    
+    def set_configuration_enabled(self, enabled):
+        """
+        Allow or block configuration changes
+        
+        The preview sanitizes on a worker thread using the processor's
+        sanitizers and shared mappings, so edits are blocked until it is done.
+        
+        Args:
+            enabled: Whether fields, common records and configurations can be changed
+        """
+        state = "normal" if enabled else "disabled"
+        self.common_records_btn.config(state=state)
+        self.load_config_btn.config(state=state)
+        self.data_grid.config_enabled = enabled
     
     def show_common_records_dialog(self):
         """Show dialog for configuring common records"""
@@ -77,9 +94,8 @@ class ReviewTab(ttk.Frame):
         logger.info(f"Review tab received data with shape: {data.shape}")
         
         # Get data processor from import tab
-        import_tab = self.master.winfo_children()[0]  # First tab is import tab
-        self.data_processor = import_tab.get_processor()
-        self.detected_fields = getattr(import_tab, 'detected_fields', {})
+        self.data_processor = self.import_tab.get_processor()
+        self.detected_fields = getattr(self.import_tab, 'detected_fields', {})
         
         logger.info(f"Retrieved detected fields: {list(self.detected_fields.keys())}")
         
@@ -0,0 +1,192 @@
+import tkinter as tk
+import logging
+
+logger = logging.getLogger('phi_cleanse')
+
+# Tcl procedure inserting a list of rows into a treeview in one call. Rows
+# that fail are skipped and returned as a list of {position message} pairs
+_INSERT_ROWS_PROC = 'phi_cleanse_insert_rows'
+_INSERT_ROWS_SCRIPT = f"""
+proc {_INSERT_ROWS_PROC} {{tree rows tags}} {{
+    set errors {{}}
+    set position 0
+    foreach row $rows {{
+        if {{[catch {{$tree insert {{}} end -values $row -tags $tags}} message]}} {{
+            lappend errors [list $position $message]
+        }}
+        incr position
+    }}
+    return $errors
+}}
+"""
+
+# Tcl procedure replacing the values of existing items in one call
+_SET_ROWS_PROC = 'phi_cleanse_set_rows'
+_SET_ROWS_SCRIPT = f"""
+proc {_SET_ROWS_PROC} {{tree items rows}} {{
+    foreach item $items row $rows {{
+        $tree item $item -values $row
+    }}
+}}
+"""
+
+# Rows sent to Tcl per insert call
+INSERT_BATCH_SIZE = 500
+
+# Rows moved per mouse wheel notch
+WHEEL_SCROLL_ROWS = 3
+
+class VirtualRowsMixin:
+    """
+    Virtual scrolling for a ttk.Treeview showing a large list of rows
+    
+    All rows are kept in self._rows and only the window that fits in the
+    table is put in the treeview, so Tk holds a screenful of items however
+    many rows there are. The vertical scrollbar tracks the position in
+    self._rows instead of the treeview.
+    
+    Classes using this set self.table and self.y_scroll and then call
+    setup_virtual_rows(). row_tags() can be overridden to tag inserted rows.
+    """
+    
+    def setup_virtual_rows(self):
+        """Initialize the row window and bind scrolling to self.table"""
+        self._rows = []
+        self._first_row = 0
+        self._slots = []
+        
+        self.y_scroll.config(command=self.on_vertical_scroll)
+        
+        self.table.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.table.bind("<Button-4>", self.on_mouse_wheel)
+        self.table.bind("<Button-5>", self.on_mouse_wheel)
+        self.table.bind("<Configure>", lambda e: self.render_rows())
+        
+        # Define the bulk insert/update procedures in this widget's interpreter
+        self.tk.eval(_INSERT_ROWS_SCRIPT)
+        self.tk.eval(_SET_ROWS_SCRIPT)
+    
+    def row_tags(self):
+        """Tags given to every row inserted into the table"""
+        return ()
+    
+    def set_rows(self, rows):
+        """
+        Replace the rows and show them from the top
+        
+        Args:
+            rows: List of row value lists
+        """
+        self._rows = rows
+        self._first_row = 0
+        self.render_rows()
+    
+    def clear_rows(self):
+        """Remove the rows currently shown in the table"""
+        self.table.delete(*self._slots)
+        self._slots = []
+    
+    def visible_row_count(self):
+        """Number of rows that fit in the table's current height"""
+        height = self.table.winfo_height()
+        bbox = self.table.bbox(self._slots[0]) if self._slots else ''
+        if height <= 1 or not bbox:
+            # Not laid out yet; use the requested height in rows
+            return max(int(self.table.cget('height')), 1)
+        
+        # bbox gives the first row's offset below the headings and its height
+        top, row_height = int(bbox[1]), int(bbox[3])
+        return max((height - top) // max(row_height, 1), 1)
+    
+    def render_rows(self):
+        """Show the window of rows starting at self._first_row"""
+        count = self.visible_row_count()
+        self._first_row = max(min(self._first_row, len(self._rows) - count), 0)
+        window = self._rows[self._first_row:self._first_row + count]
+        
+        # Reuse the existing items, adding or removing some if the window size changed
+        if len(self._slots) > len(window):
+            self.table.delete(*self._slots[len(window):])
+            del self._slots[len(window):]
+        
+        reused = len(self._slots)
+        if reused:
+            self.tk.call(
+                _SET_ROWS_PROC,
+                str(self.table),
+                tuple(self._slots),
+                tuple(tuple(values) for values in window[:reused])
+            )
+        if len(window) > reused:
+            self.insert_rows(window[reused:], range(self._first_row + reused, self._first_row + len(window)))
+            self._slots = list(self.table.get_children())
+        
+        # Selections would point at other rows once the window moves
+        self.table.selection_remove(*self.table.selection())
+        
+        if self._rows:
+            self.y_scroll.set(
+                self._first_row / len(self._rows),
+                (self._first_row + len(window)) / len(self._rows)
+            )
+        else:
+            self.y_scroll.set(0, 1)
+    
+    def scroll_rows(self, first_row):
+        """Move the visible window so it starts at first_row"""
+        first_row = max(min(first_row, len(self._rows) - len(self._slots)), 0)
+        if first_row != self._first_row:
+            self._first_row = first_row
+            self.render_rows()
+    
+    def on_vertical_scroll(self, action, amount, unit=None):
+        """Handle the vertical scrollbar's moveto/scroll commands"""
+        if action == "moveto":
+            self.scroll_rows(int(float(amount) * len(self._rows)))
+        elif action == "scroll":
+            step = int(amount)
+            if unit == "pages":
+                step *= max(len(self._slots) - 1, 1)
+            self.scroll_rows(self._first_row + step)
+    
+    def on_mouse_wheel(self, event):
+        """Handle vertical scrolling with the mouse wheel"""
+        if event.num == 4:
+            notches = -1
+        elif event.num == 5:
+            notches = 1
+        else:
+            notches = int(-1 * (event.delta / 120)) or (-1 if event.delta > 0 else 1)
+        self.scroll_rows(self._first_row + notches * WHEEL_SCROLL_ROWS)
+        return "break"
+    
+    def insert_rows(self, rows, index=None):
+        """
+        Insert rows with the current row tags, one Tcl call per batch
+        
+        Args:
+            rows: List of row value lists
+            index: Optional row labels used in error messages
+        """
+        index = list(range(len(rows)) if index is None else index)
+        tags = tuple(self.row_tags())
+        
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            batch = rows[start:start + INSERT_BATCH_SIZE]
+            try:
+                errors = self.tk.call(
+                    _INSERT_ROWS_PROC,
+                    str(self.table),
+                    tuple(tuple(values) for values in batch),
+                    tags
+                )
+            except tk.TclError as e:
+                logger.error(f"Error inserting rows {index[start]} to {index[start + len(batch) - 1]}: {str(e)}")
+                continue
+            
+            for error in self.tk.splitlist(errors):
+                position, message = self.tk.splitlist(error)
+                row = start + int(position)
+                logger.error(f"Error inserting row {index[row]}: {message}")
+                logger.error(f"Row values: {rows[row]}")
+
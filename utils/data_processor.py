@@ -2,13 +2,30 @@ import logging
 import pandas as pd
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Tuple, Optional
 
 from .phi_detector import PHIDetector
 from components.sanitizers import get_sanitizer
+from components.sanitizers.persistence import load_mapping_file
 
 logger = logging.getLogger('phi_cleanse')
 
+# Text columns with fewer distinct values than this share of their rows are
+# stored as categoricals after import
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+def _decode_categorical(series: pd.Series) -> pd.Series:
+    """
+    Convert a categorical series back to its categories' dtype
+    
+    Sanitizers write new values that are not among the categories, so a
+    column compacted on import is decoded before it is sanitized.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(series.cat.categories.dtype)
+    return series
+
 class DataProcessor:
     """Handles data processing and sanitization"""
     
@@ -18,6 +35,12 @@ class DataProcessor:
         self.field_configs = {}
         self.sanitizers = {}
         self.common_records = {}
+        
+        # Shared group mappings by file path. Sanitizers add to these dicts in
+        # place, so once loaded they stay current and are not re-read
+        self._mapping_cache = {}
+        # Individual mapping file path -> sanitizer that already holds it
+        self._loaded_mappings = {}
     
     def process_file(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
         """
@@ -29,15 +52,54 @@ class DataProcessor:
         Returns:
             Tuple of (processed DataFrame, detected PHI fields)
         """
-        self.imported_data = data
-        
         # Detect PHI fields
         detected_fields = self.phi_detector.analyze_fields(data)
         
         logger.info(f"Detected {len(detected_fields)} potential PHI fields")
         
+        data = self._compact_dtypes(data, detected_fields)
+        self.imported_data = data
+        
         return data, detected_fields
     
+    def _compact_dtypes(self, data: pd.DataFrame, skip_columns) -> pd.DataFrame:
+        """
+        Store low-cardinality text columns as categoricals and downcast integers
+        
+        Detected PHI columns are left alone since they are replaced during
+        sanitization anyway. Float columns are not downcast because float32
+        values no longer round-trip to the same text on export.
+        
+        Args:
+            data: The imported DataFrame
+            skip_columns: Columns to leave unchanged
+            
+        Returns:
+            DataFrame with compacted column dtypes
+        """
+        before = data.memory_usage(deep=True).sum()
+        compacted = {}
+        
+        for col, series in data.items():
+            if col in skip_columns or len(series) == 0:
+                continue
+            
+            if pd.api.types.is_integer_dtype(series.dtype):
+                compacted[col] = pd.to_numeric(series, downcast='integer')
+            elif pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+                if series.nunique(dropna=True) / len(series) < CATEGORY_MAX_UNIQUE_RATIO:
+                    compacted[col] = series.astype('category')
+        
+        if not compacted:
+            return data
+        
+        data = data.copy(deep=False)
+        for col, series in compacted.items():
+            data[col] = series
+        after = data.memory_usage(deep=True).sum()
+        logger.info(f"Compacted {len(compacted)} columns: {before} -> {after} bytes")
+        return data
+    
     def configure_field(self, field_name: str, config: Dict) -> None:
         """
         Configure sanitization settings for a field
@@ -76,27 +138,68 @@ class DataProcessor:
         
         # Initialize mappings for each group
         for group_id, fields in records.items():
-            # Create a shared mapping file for the group
-            mapping_file = os.path.join('configs', 'mappings', f"{group_id}.json")
-            
-            # Load existing mapping if available
-            shared_mapping = {}
-            if os.path.exists(mapping_file):
-                try:
-                    with open(mapping_file, 'r') as f:
-                        shared_mapping = json.load(f)
-                except Exception as e:
-                    logger.error(f"Error loading mapping for {group_id}: {str(e)}")
+            # Load the group's shared mapping if available
+            mapping_file, shared_mapping = self._load_shared_mapping(group_id)
             
             # Ensure each field in the group uses the shared mapping
             for field in fields:
                 if field in self.sanitizers:
                     self.sanitizers[field].set_shared_mapping(shared_mapping, mapping_file)
     
-    def sanitize_data(self) -> pd.DataFrame:
+    def _load_shared_mapping(self, group_id: str) -> Tuple[str, Dict]:
+        """
+        Get the shared mapping for a common record group
+        
+        The mapping file is read the first time only; later calls return the
+        same dict, which the group's sanitizers keep up to date.
+        
+        Args:
+            group_id: ID of the common record group
+            
+        Returns:
+            Tuple of (mapping file path, mapping dict)
+        """
+        mapping_file = os.path.join('configs', 'mappings', f"{group_id}.json")
+        if mapping_file in self._mapping_cache:
+            return mapping_file, self._mapping_cache[mapping_file]
+        
+        try:
+            shared_mapping = load_mapping_file(mapping_file)
+        except Exception as e:
+            # Not cached, so the file is tried again next time
+            logger.error(f"Error loading mapping for {group_id}: {str(e)}")
+            return mapping_file, {}
+        
+        self._mapping_cache[mapping_file] = shared_mapping
+        return mapping_file, shared_mapping
+    
+    def snapshot_configuration(self) -> Tuple[Dict, Dict, Dict]:
+        """
+        Copy the current configuration for use by sanitize_data
+        
+        Returns:
+            Tuple of (field configs, sanitizers, common records) copies
+        """
+        return (
+            dict(self.field_configs),
+            dict(self.sanitizers),
+            {group_id: list(fields) for group_id, fields in self.common_records.items()}
+        )
+    
+    def sanitize_data(self, field_configs: Optional[Dict] = None, sanitizers: Optional[Dict] = None,
+                      common_records: Optional[Dict] = None) -> pd.DataFrame:
         """
         Sanitize the data based on current configuration
         
+        Callers running this off the Tk thread pass snapshots of the
+        configuration (see snapshot_configuration) so edits made meanwhile
+        do not change the dicts being iterated.
+        
+        Args:
+            field_configs: Field configurations to use instead of self.field_configs
+            sanitizers: Sanitizers to use instead of self.sanitizers
+            common_records: Common record groups to use instead of self.common_records
+            
         Returns:
             DataFrame with sanitized data
         """
@@ -104,24 +207,24 @@ class DataProcessor:
             logger.error("No data to sanitize")
             return None
         
-        sanitized_data = self.imported_data.copy()
+        if field_configs is None:
+            field_configs = self.field_configs
+        if sanitizers is None:
+            sanitizers = self.sanitizers
+        if common_records is None:
+            common_records = self.common_records
+        
+        # Sanitized columns are assigned over a shallow copy, so columns
+        # that are not sanitized are shared with imported_data rather than copied
+        sanitized_data = self.imported_data.copy(deep=False)
         
         # Track which fields have been processed to avoid double-processing
         processed_fields = set()
         
         # First process fields in common record groups
-        for group_id, fields in self.common_records.items():
-            # Create shared mapping file for the group
-            mapping_file = os.path.join('configs', 'mappings', f"{group_id}.json")
-            shared_mapping = {}
-            
-            # Load existing shared mapping if available
-            if os.path.exists(mapping_file):
-                try:
-                    with open(mapping_file, 'r') as f:
-                        shared_mapping = json.load(f)
-                except Exception as e:
-                    logger.error(f"Error loading mapping for {group_id}: {str(e)}")
+        for group_id, fields in common_records.items():
+            # Get the group's shared mapping, loaded once per mapping file
+            mapping_file, shared_mapping = self._load_shared_mapping(group_id)
             
             # Process each field in the group
             for field_name in fields:
@@ -129,8 +232,8 @@ class DataProcessor:
                     logger.warning(f"Field not found in data: {field_name}")
                     continue
                 
-                config = self.field_configs.get(field_name, {})
-                sanitizer = self.sanitizers.get(field_name)
+                config = field_configs.get(field_name, {})
+                sanitizer = sanitizers.get(field_name)
                 if not sanitizer:
                     continue
                 
@@ -140,7 +243,7 @@ class DataProcessor:
                     
                     # Sanitize the field
                     sanitized_data[field_name] = sanitizer.sanitize_series(
-                        sanitized_data[field_name],
+                        _decode_categorical(sanitized_data[field_name]),
                         preserve_format=config.get('preserve_format', True)
                     )
                     
@@ -150,44 +253,85 @@ class DataProcessor:
                 except Exception as e:
                     logger.error(f"Error sanitizing field {field_name}: {str(e)}")
         
-        # Process remaining fields that aren't part of any group
-        for field_name, config in self.field_configs.items():
-            if field_name in processed_fields:
-                continue
+        # Process remaining fields that aren't part of any group. Each uses its
+        # own sanitizer and mapping, so they are sanitized concurrently and
+        # the results assigned back here on the calling thread
+        if any(
+            config.get('consistent_mapping')
+            for field_name, config in field_configs.items()
+            if field_name not in processed_fields
+        ):
+            os.makedirs(os.path.join('configs', 'mappings'), exist_ok=True)
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {}
+            for field_name, config in field_configs.items():
+                if field_name in processed_fields:
+                    continue
+                    
+                if field_name not in sanitized_data.columns:
+                    logger.warning(f"Field not found in data: {field_name}")
+                    continue
                 
-            if field_name not in sanitized_data.columns:
-                logger.warning(f"Field not found in data: {field_name}")
-                continue
-            
-            sanitizer = self.sanitizers.get(field_name)
-            if not sanitizer:
-                continue
-            
-            try:
-                # Use individual mapping for non-grouped fields
-                if config.get('consistent_mapping'):
-                    mapping_file = os.path.join('configs', 'mappings', f"{field_name}.json")
-                    if os.path.exists(mapping_file):
-                        sanitizer.load_mapping(mapping_file)
+                sanitizer = sanitizers.get(field_name)
+                if not sanitizer:
+                    continue
                 
-                # Sanitize the field
-                sanitized_data[field_name] = sanitizer.sanitize_series(
-                    sanitized_data[field_name],
-                    preserve_format=config.get('preserve_format', True)
+                futures[field_name] = executor.submit(
+                    self._sanitize_field,
+                    field_name,
+                    config,
+                    sanitizer,
+                    _decode_categorical(sanitized_data[field_name])
                 )
-                
-                # Save individual mapping
-                if config.get('consistent_mapping'):
-                    os.makedirs(os.path.join('configs', 'mappings'), exist_ok=True)
-                    sanitizer.save_mapping(mapping_file)
-                
-                logger.info(f"Sanitized field: {field_name}")
-                
-            except Exception as e:
-                logger.error(f"Error sanitizing field {field_name}: {str(e)}")
+            
+            for field_name, future in futures.items():
+                result = future.result()
+                if result is not None:
+                    sanitized_data[field_name] = result
         
         return sanitized_data
     
+    def _sanitize_field(self, field_name: str, config: Dict, sanitizer, series: pd.Series) -> Optional[pd.Series]:
+        """
+        Sanitize a field that is not part of a common record group
+        
+        Args:
+            field_name: Name of the field
+            config: Field configuration
+            sanitizer: Sanitizer for the field
+            series: The field's data
+            
+        Returns:
+            The sanitized series, or None if sanitization failed
+        """
+        try:
+            # Use individual mapping for non-grouped fields
+            if config.get('consistent_mapping'):
+                mapping_file = os.path.join('configs', 'mappings', f"{field_name}.json")
+                # A sanitizer that saved this file last run already holds it
+                if self._loaded_mappings.get(mapping_file) is not sanitizer:
+                    if os.path.exists(mapping_file):
+                        sanitizer.load_mapping(mapping_file)
+                    self._loaded_mappings[mapping_file] = sanitizer
+            
+            # Sanitize the field
+            sanitized = sanitizer.sanitize_series(
+                series,
+                preserve_format=config.get('preserve_format', True)
+            )
+            
+            # Save individual mapping (the directory is created by sanitize_data)
+            if config.get('consistent_mapping'):
+                sanitizer.save_mapping(mapping_file)
+            
+            logger.info(f"Sanitized field: {field_name}")
+            return sanitized
+            
+        except Exception as e:
+            logger.error(f"Error sanitizing field {field_name}: {str(e)}")
+            return None
+    
     def save_configuration(self, filename: str) -> None:
         """
         Save current configuration to file
@@ -245,8 +389,11 @@ class DataProcessor:
             if not os.path.exists('configs'):
                 return []
             
-            return [f for f in os.listdir('configs') 
-                   if f.endswith('.json') and os.path.isfile(os.path.join('configs', f))]
+            # scandir reports each entry's type from the directory listing,
+            # so files are picked out without a stat call per entry
+            with os.scandir('configs') as entries:
+                return [entry.name for entry in entries
+                       if entry.name.endswith('.json') and entry.is_file()]
         except Exception as e:
             logger.error(f"Error listing configurations: {str(e)}")
             return []
@@ -1,15 +1,26 @@
 import pandas as pd
+import numpy as np
 import logging
-from Levenshtein import ratio
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
 import os
 
 logger = logging.getLogger('phi_cleanse')
 
+# Minimum similarity for a fuzzy field-name match
+MIN_FUZZY_SCORE = 0.7
+
 class PHIDetector:
     """Detects potential PHI fields in data based on field names and patterns"""
     
     def __init__(self):
         self.protected_fields = None
+        self._primary_fields = []
+        self._primary_lc = []
+        self._aliases_lc = []
+        self._exact_index = {}
+        self._candidates_lc = []
+        self._candidate_fields = []
         self.load_protected_fields()
     
     def load_protected_fields(self):
@@ -24,64 +35,41 @@ class PHIDetector:
         except Exception as e:
             logger.error(f"Error loading protected fields: {str(e)}")
             self.protected_fields = pd.DataFrame(columns=['primary_field', 'common_aliases'])
-    
-    def analyze_field_name(self, field_name):
-        """Analyze a single field name and return potential PHI type"""
-        if self.protected_fields is None:
-            return None
         
-        field_name = field_name.lower().strip()
-        best_match = None
-        best_score = 0.7  # Minimum similarity threshold
+        # Lowercase the names and split the aliases once, rather than for
+        # every row of every field name analyzed
+        self._primary_fields = self.protected_fields['primary_field'].tolist()
+        self._primary_lc = [field.lower() for field in self._primary_fields]
+        self._aliases_lc = [
+            [alias.strip().lower() for alias in aliases.split(',') if alias.strip()]
+            for aliases in self.protected_fields['common_aliases'].fillna('').tolist()
+        ]
         
-        for _, row in self.protected_fields.iterrows():
-            # Check exact match with primary field
-            if field_name == row['primary_field'].lower():
-                return {
-                    'field_type': row['primary_field'],
-                    'confidence': 1.0,
-                    'match_type': 'exact'
-                }
-            
-            # Check aliases
-            aliases = [alias.strip().lower() for alias in row['common_aliases'].split(',')]
-            if field_name in aliases:
-                return {
-                    'field_type': row['primary_field'],
-                    'confidence': 1.0,
-                    'match_type': 'alias'
-                }
-            
-            # Check fuzzy matches
-            # First check primary field
-            score = ratio(field_name, row['primary_field'].lower())
-            if score > best_score:
-                best_score = score
-                best_match = {
-                    'field_type': row['primary_field'],
-                    'confidence': score,
-                    'match_type': 'fuzzy'
-                }
-            
-            # Then check aliases
+        # Exact and alias matches looked up by name. When a name appears more
+        # than once, the first row (and a primary field before its aliases) wins
+        self._exact_index = {}
+        for primary, primary_lc, aliases in zip(self._primary_fields, self._primary_lc, self._aliases_lc):
+            self._exact_index.setdefault(primary_lc, (primary, 'exact'))
             for alias in aliases:
-                score = ratio(field_name, alias)
-                if score > best_score:
-                    best_score = score
-                    best_match = {
-                        'field_type': row['primary_field'],
-                        'confidence': score,
-                        'match_type': 'fuzzy'
-                    }
+                self._exact_index.setdefault(alias, (primary, 'alias'))
         
-        return best_match
+        # Every primary field and alias in scan order, with the primary field
+        # each one belongs to, for fuzzy matching
+        self._candidates_lc = []
+        self._candidate_fields = []
+        for primary, primary_lc, aliases in zip(self._primary_fields, self._primary_lc, self._aliases_lc):
+            self._candidates_lc.extend([primary_lc] + aliases)
+            self._candidate_fields.extend([primary] * (len(aliases) + 1))
+    
+    def analyze_field_name(self, field_name):
+        """Analyze a single field name and return potential PHI type"""
+        return self._match_field_names([field_name])[0]
     
     def analyze_fields(self, df):
         """Analyze all fields in a dataframe and return PHI field suggestions"""
         results = {}
         
-        for column in df.columns:
-            match = self.analyze_field_name(column)
+        for column, match in zip(df.columns, self._match_field_names(list(df.columns))):
             if match:
                 results[column] = match
                 logger.info(f"Detected potential PHI field: {column} -> {match['field_type']} "
@@ -89,6 +77,66 @@ class PHIDetector:
         
         return results
     
+    def _match_field_names(self, field_names):
+        """
+        Find the best protected field for each of a list of field names
+        
+        Exact and alias matches come from the lookup index. The remaining
+        names are scored against every primary field and alias in one
+        rapidfuzz cdist call; Indel normalized similarity is the same score
+        Levenshtein.ratio gives.
+        
+        Args:
+            field_names: Field names to analyze
+            
+        Returns:
+            List with a match dict (or None) for each field name
+        """
+        if self.protected_fields is None:
+            return [None] * len(field_names)
+        
+        names = [field_name.lower().strip() for field_name in field_names]
+        matches = [None] * len(names)
+        fuzzy_positions = []
+        
+        for position, name in enumerate(names):
+            # Check exact match with a primary field or alias
+            hit = self._exact_index.get(name)
+            if hit:
+                matches[position] = {
+                    'field_type': hit[0],
+                    'confidence': 1.0,
+                    'match_type': hit[1]
+                }
+            else:
+                fuzzy_positions.append(position)
+        
+        if not fuzzy_positions or not self._candidates_lc:
+            return matches
+        
+        # Check fuzzy matches; argmax keeps the first candidate on ties, as
+        # scanning in order with a strict comparison did. Pairs below the
+        # cutoff are abandoned early by rapidfuzz and scored 0
+        scores = process.cdist(
+            [names[position] for position in fuzzy_positions],
+            self._candidates_lc,
+            scorer=Indel.normalized_similarity,
+            dtype=np.float64,
+            score_cutoff=MIN_FUZZY_SCORE,
+            workers=-1  # Split the score matrix across all cores
+        )
+        best = scores.argmax(axis=1)
+        for position, row, candidate in zip(fuzzy_positions, scores, best):
+            score = float(row[candidate])
+            if score > MIN_FUZZY_SCORE:
+                matches[position] = {
+                    'field_type': self._candidate_fields[candidate],
+                    'confidence': score,
+                    'match_type': 'fuzzy'
+                }
+        
+        return matches
+    
     def analyze_data_patterns(self, df, column):
         """Analyze data patterns in a column to confirm PHI type"""
         # This will be implemented to analyze actual data patterns